@@ -5,134 +5,474 @@ Extracts contributor information from major blockchain GitHub repositories
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import csv
-import json
 import time
 import os
+import random
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional
 import logging
 import ssl
 import socket
-from urllib.parse import urlparse
+
+from github_client import (GRAPHQL_MAX_NODES, PROFILE_CACHE_TTL, USER_PROFILES_QUERY, GitHubCache,
+                           GitHubTokenPool, decode_json, get_retry_delay, graphql_user_to_rest,
+                           has_insufficient_scopes, is_core_rate_limit)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+class ContributorRow(NamedTuple):
+    """A contributor of a repository, one output row (fields in column order)"""
+    project_name: str
+    project_url: str
+    contributor_username: str
+    contributor_url: str
+    contributor_name: str
+    contributor_email: str
+    contributions: int
+    twitter: str
+    linkedin: str
+    website: str
+    blog: str
+    location: str
+    company: str
+    bio: str
+    followers: int
+    following: int
+    public_repos: int
+    account_created: str
+    last_updated: str
+
+class BlockchainContributorRow(NamedTuple):
+    """A ContributorRow extended with the metadata of its blockchain and repository"""
+    project_name: str
+    project_url: str
+    contributor_username: str
+    contributor_url: str
+    contributor_name: str
+    contributor_email: str
+    contributions: int
+    twitter: str
+    linkedin: str
+    website: str
+    blog: str
+    location: str
+    company: str
+    bio: str
+    followers: int
+    following: int
+    public_repos: int
+    account_created: str
+    last_updated: str
+    blockchain_name: str
+    blockchain_layer_type: str
+    blockchain_category: str
+    blockchain_purpose: str
+    blockchain_description: str
+    repo_stars: int
+    repo_description: str
+
+# Owner and repository name of a GitHub repository URL
+GITHUB_REPO_URL_RE = re.compile(r'github\.com/([^/?#]+)/([^/?#]+)')
+
+# Columns of a contributor row, in output order
+CONTRIBUTOR_FIELDNAMES = ContributorRow._fields
+
+# Columns of a contributor row of the top-repositories flow, in output order
+BLOCKCHAIN_CONTRIBUTOR_FIELDNAMES = BlockchainContributorRow._fields
+
+# Low-cardinality columns, repeated for every contributor of a project or
+# blockchain, which are dictionary-encoded in Parquet output
+DICTIONARY_COLUMNS = frozenset({
+    'project_name', 'project_url', 'blockchain_name', 'blockchain_layer_type', 'blockchain_category',
+    'blockchain_purpose', 'blockchain_description', 'repo_description'
+})
+
+# Repositories whose contributor profiles are looked up together
+REPOS_PER_BATCH = 20
+
+# Contributors with fewer contributions than this are skipped before their profile is fetched
+MIN_CONTRIBUTIONS = 5
+
+# Below this many remaining requests the limiter starts reducing concurrency
+LOW_RATE_LIMIT_THRESHOLD = 100
+
+class GitHubRateLimiter:
+    """
+    Bounds concurrent GitHub API requests and adapts to the rate limit budget
+    
+    The budget is taken from the X-RateLimit-* headers of each response. When it
+    runs low, fewer requests are allowed in flight and they are spaced out so the
+    remaining budget lasts until the window resets; a Retry-After response pauses
+    all new requests until the requested delay has passed. An optional
+    requests-per-minute cap spaces requests out regardless of the budget.
+    """
+
+    def __init__(self, max_concurrent: int, max_requests_per_minute: Optional[int] = None):
+        self.max_concurrent = max_concurrent
+        self._min_interval = 60.0 / max_requests_per_minute if max_requests_per_minute else 0.0
+        self.remaining = 5000
+        self.reset = 0
+        # Reset time on the monotonic clock, so waits are immune to wall-clock jumps
+        self._reset_deadline = 0.0
+        self._next_request_at = 0.0
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._resumed = threading.Event()
+        self._resumed.set()
+
+    def _concurrency_limit(self) -> int:
+        """Number of requests allowed in flight for the current budget"""
+        if self.remaining >= LOW_RATE_LIMIT_THRESHOLD:
+            return self.max_concurrent
+        return max(1, self.max_concurrent * self.remaining // LOW_RATE_LIMIT_THRESHOLD)
+
+    def _pace(self):
+        """Space requests to the per-minute cap, and evenly over the rest of the window when the budget is low"""
+        with self._condition:
+            interval = self._min_interval
+            if self.remaining < LOW_RATE_LIMIT_THRESHOLD:
+                interval = max(interval, self.seconds_until_reset() / max(self.remaining, 1))
+            if not interval:
+                return
+            now = time.monotonic()
+            start = max(now, self._next_request_at)
+            self._next_request_at = start + interval
+        
+        if start > now:
+            time.sleep(start - now)
+
+    def __enter__(self):
+        self._resumed.wait()
+        self._pace()
+        with self._condition:
+            while self._in_flight >= self._concurrency_limit():
+                self._condition.wait()
+            self._in_flight += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def update(self, headers):
+        """Update the budget from the rate limit headers of a response"""
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        self.set_budget(None if remaining is None else int(remaining),
+                        None if reset is None else int(reset))
+
+    def set_budget(self, remaining: Optional[int], reset: Optional[int]):
+        """Set the remaining budget and the epoch time its window resets (None leaves a value unchanged)"""
+        with self._condition:
+            if remaining is not None:
+                self.remaining = remaining
+            if reset is not None:
+                self.reset = reset
+                self._reset_deadline = time.monotonic() + (self.reset - time.time())
+            self._condition.notify_all()
+
+    def seconds_until_reset(self) -> float:
+        """Seconds left until the current rate limit window resets"""
+        return max(0.0, self._reset_deadline - time.monotonic())
+
+    def pause(self, seconds: float):
+        """Hold back all new requests for the given number of seconds"""
+        self._resumed.clear()
+        try:
+            time.sleep(seconds)
+        finally:
+            self._resumed.set()
+
 class GitHubContributorExtractor:
-    def __init__(self, token: Optional[str] = None, blockchain_csv_path: str = 'evm_blockchains.csv'):
+    def __init__(self, token: Optional[str] = None, blockchain_csv_path: str = 'evm_blockchains.csv',
+                 max_concurrent_requests: int = 8, max_parallel_repos: int = 4, max_parallel_orgs: int = 2,
+                 cache_path: Optional[str] = 'github_cache.sqlite',
+                 max_requests_per_minute: Optional[int] = None, profile_cache_ttl: int = PROFILE_CACHE_TTL,
+                 tokens: Optional[List[str]] = None, min_contributions: int = MIN_CONTRIBUTIONS):
         """
         Initialize the GitHub contributor extractor
         
         Args:
             token: GitHub personal access token for API authentication
             blockchain_csv_path: Path to CSV file containing blockchain data
+            max_concurrent_requests: Maximum number of GitHub API requests in flight at once
+            max_parallel_repos: Number of repositories processed concurrently
+            max_parallel_orgs: Number of blockchain organizations processed concurrently
+                in the top-repositories flow
+            cache_path: SQLite file used to store ETags and response bodies for
+                conditional requests, and user profiles across runs (None disables the cache)
+            max_requests_per_minute: Optional cap on the request rate (None for no cap)
+            profile_cache_ttl: Seconds a user profile stored in the cache is reused
+                without contacting GitHub
+            tokens: Several GitHub tokens to rotate requests over, each adding
+                its own rate limit (used instead of token when given)
+            min_contributions: Contributors with fewer contributions to a repository
+                are left out, and their profiles are never fetched
         """
-        self.token = token
-        self.headers = {
+        self.token_pool = GitHubTokenPool(tokens or ([token] if token else []))
+        # The GraphQL API only accepts authenticated requests, and is turned off
+        # when the token lacks the scope its profile lookups need
+        self.use_graphql = bool(self.token_pool)
+        self.base_url = 'https://api.github.com'
+        
+        # Requests are I/O-bound, so they are fanned out over threads;
+        # the rate limiter bounds how many are in flight at any time
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_parallel_repos = max_parallel_repos
+        self.max_parallel_orgs = max_parallel_orgs
+        self.min_contributions = min_contributions
+        self.rate_limiter = GitHubRateLimiter(max_concurrent_requests, max_requests_per_minute)
+        # Long-lived pool shared by every fan-out of individual requests; its tasks
+        # never submit further work, so repositories running in parallel can share it
+        self._request_executor = ThreadPoolExecutor(max_workers=max_concurrent_requests,
+                                                    thread_name_prefix='github-request')
+        
+        # Profiles already fetched during this run, keyed by username; profiles
+        # from earlier runs are loaded from the cache file while still fresh
+        self.profile_cache_ttl = profile_cache_ttl
+        self._user_cache: Dict[str, Dict] = {}
+        self._user_cache_lock = threading.Lock()
+        
+        # Single session reused for every request so connections to
+        # api.github.com are pooled and kept alive between calls. The pool holds
+        # one connection per concurrent request and blocks rather than opening
+        # extra short-lived connections, so every TLS handshake is reused.
+        # Headers are set on the session once and sent with every request,
+        # except Authorization, which carries the token picked for each request.
+        self.session = requests.Session()
+        self.session.headers.update({
             'Accept': 'application/vnd.github.v3+json',
             'User-Agent': 'Blockchain-Contributors-Extractor'
-        }
-        if token:
-            self.headers['Authorization'] = f'token {token}'
+        })
+        self.session.verify = True
+        # Connection errors, timeouts and 5xx responses are retried by the adapter
+        # with exponential backoff (GraphQL queries are read-only, so POST is
+        # retried too). Retry-After is not honored here, so 403/429 responses always
+        # reach make_request and graphql, which pause every thread and rotate tokens
+        retry = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504],
+                      allowed_methods=['GET', 'POST'], raise_on_status=False,
+                      respect_retry_after_header=False)
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrent_requests,
+                                                   pool_block=True, max_retries=retry))
         
-        self.base_url = 'https://api.github.com'
-        self.rate_limit_remaining = 5000
-        self.rate_limit_reset = 0
+        # Persistent ETag cache so unchanged resources come back as 304 Not Modified
+        self._cache = GitHubCache.open(cache_path) if cache_path else None
+        # Conditional requests sent, and how many of them came back 304
+        self._stats_lock = threading.Lock()
+        self._revalidations = 0
+        self._not_modified = 0
         
         # Load blockchain data from CSV file
         self.blockchain_repos = self._load_blockchain_data(blockchain_csv_path)
 
     def check_rate_limit(self):
-        """Check and respect GitHub API rate limits"""
-        if self.rate_limit_remaining <= 1:
-            wait_time = max(0, self.rate_limit_reset - int(time.time()))
+        """Check and respect GitHub API rate limits
+        
+        The budget is tracked from the X-RateLimit-* headers of previous
+        responses, so this never issues a request of its own.
+        """
+        if self.rate_limiter.remaining <= 1:
+            wait_time = self.rate_limiter.seconds_until_reset()
             if wait_time > 0:
-                logger.warning(f"Rate limit exceeded. Waiting {wait_time} seconds...")
+                logger.warning(f"Rate limit exceeded. Waiting {wait_time:.0f} seconds...")
                 time.sleep(wait_time)
+
+    def _backoff(self, attempt: int):
+        """Sleep before a retry using exponential backoff with jitter"""
+        time.sleep(2 ** attempt + random.random())
+
+    def _get_cached_user(self, username: str) -> Optional[Dict]:
+        """Return the profile of a user fetched during this run, or stored by a recent one"""
+        with self._user_cache_lock:
+            cached = self._user_cache.get(username)
+        if cached is not None or self._cache is None:
+            return cached
         
-        # Make a request to check current rate limit
-        try:
-            response = requests.get(f"{self.base_url}/rate_limit", headers=self.headers)
-            if response.status_code == 200:
-                data = response.json()
-                self.rate_limit_remaining = data['rate']['remaining']
-                self.rate_limit_reset = data['rate']['reset']
-                logger.info(f"Rate limit remaining: {self.rate_limit_remaining}")
-        except Exception as e:
-            logger.error(f"Error checking rate limit: {e}")
+        user_data = self._cache.get_profiles([username], self.profile_cache_ttl).get(username)
+        if user_data is None:
+            return None
+        
+        with self._user_cache_lock:
+            self._user_cache[username] = user_data
+        return user_data
+
+    def _cache_users(self, profiles: Dict[str, Dict]):
+        """Remember user profiles for the rest of the run and store them for later runs"""
+        if not profiles:
+            return
+        with self._user_cache_lock:
+            self._user_cache.update(profiles)
+        if self._cache is not None:
+            self._cache.store_profiles(profiles)
+
+    def _auth_headers(self, token: Optional[str]) -> Dict[str, str]:
+        """Return the Authorization header for a token, if there is one"""
+        return {'Authorization': f'token {token}'} if token else {}
+
+    def _update_budget(self, token: Optional[str], headers):
+        """Record the rate limit headers of a response to a request made with a token
+        
+        Search responses are left out, as their budget is a separate one.
+        """
+        if not is_core_rate_limit(headers):
+            return
+        if token is None:
+            self.rate_limiter.update(headers)
+            return
+        self.token_pool.update(token, headers)
+        self.rate_limiter.set_budget(*self.token_pool.budget())
+
+    def _log_cache_stats(self):
+        """Log how many conditional requests were answered from the cache"""
+        if self._revalidations:
+            logger.info(f"   🗄️  Cache hits: {self._not_modified}/{self._revalidations} conditional requests "
+                        f"({self._not_modified / self._revalidations:.0%}) returned 304 Not Modified")
+
+    def close(self):
+        """Release the worker threads, the HTTP session and the response cache"""
+        self._request_executor.shutdown()
+        self.session.close()
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
 
     def make_request(self, url: str, max_retries: int = 3) -> Optional[Dict]:
-        """Make a GitHub API request with error handling, rate limiting, and retry logic"""
+        """Make a GitHub API request with error handling, rate limiting, and retry logic
+        
+        Transient failures are retried by the session's adapter; max_retries
+        bounds how many times a rate-limited request is retried.
+        """
         self.check_rate_limit()
         
+        # Revalidate cached resources with If-None-Match instead of downloading them again
+        cached = self._cache.get_response(url) if self._cache is not None else None
+        
         for attempt in range(max_retries):
             try:
-                # Configure session with better SSL settings
-                session = requests.Session()
-                session.headers.update(self.headers)
+                # Each attempt goes to the token with the most budget left
+                token = self.token_pool.pick_token()
+                request_headers = self._auth_headers(token)
+                if cached:
+                    request_headers['If-None-Match'] = cached[0]
+                
+                with self.rate_limiter:
+                    response = self.session.get(url, headers=request_headers, timeout=30)
+                
+                self._update_budget(token, response.headers)
                 
-                # SSL configuration for better compatibility
-                session.verify = True
-                session.timeout = 30
+                if cached:
+                    with self._stats_lock:
+                        self._revalidations += 1
+                        if response.status_code == 304:
+                            self._not_modified += 1
                 
-                response = session.get(url)
+                # 304 responses are not charged against the rate limit
+                if response.status_code == 304 and cached:
+                    return cached[1]
                 
-                if response.status_code == 403:
-                    logger.error("Rate limit exceeded or access forbidden")
+                if response.status_code in (403, 429):
+                    retry_delay = get_retry_delay(response, attempt)
+                    if retry_delay is None:
+                        logger.error(f"Access forbidden: {url} - {response.text}")
+                        return None
+                    if (attempt < max_retries - 1 and response.headers.get('X-RateLimit-Remaining') == '0'
+                            and 'Retry-After' not in response.headers
+                            and is_core_rate_limit(response.headers) and self.rate_limiter.remaining > 0):
+                        # Only this token is exhausted; retry right away with another one
+                        continue
+                    if attempt < max_retries - 1:
+                        logger.warning(f"Rate limited. Pausing requests for {retry_delay} seconds before retrying...")
+                        self.rate_limiter.pause(retry_delay)
+                        self._backoff(attempt)
+                        continue
+                    logger.error("Rate limit exceeded")
                     return None
                 elif response.status_code == 404:
                     logger.error(f"Resource not found: {url}")
                     return None
                 elif response.status_code != 200:
+                    # 5xx responses have already been retried by the adapter
                     logger.error(f"Request failed: {response.status_code} - {response.text}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
                     return None
                 
-                self.rate_limit_remaining -= 1
-                return response.json()
+                data = decode_json(response.content)
+                etag = response.headers.get('ETag')
+                if etag and self._cache is not None:
+                    self._cache.store_response(url, etag, data)
+                return data
                 
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL error on attempt {attempt + 1}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                logger.error("Max retries reached for SSL error")
+                logger.error(f"SSL error: {e}")
                 return None
                 
-            except requests.exceptions.ConnectionError as e:
-                logger.error(f"Connection error on attempt {attempt + 1}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                logger.error("Max retries reached for connection error")
+            except requests.exceptions.RequestException as e:
+                # Raised once the adapter has used up its retries
+                logger.error(f"Request error: {e}")
                 return None
                 
-            except requests.exceptions.Timeout as e:
-                logger.error(f"Timeout error on attempt {attempt + 1}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                logger.error("Max retries reached for timeout error")
+            except Exception as e:
+                logger.error(f"Unexpected error: {e}")
                 return None
+        
+        return None
+
+    def graphql(self, query: str, variables: Optional[Dict] = None, max_retries: int = 3) -> Optional[Dict]:
+        """Run a GitHub GraphQL query and return its data
+        
+        Transient failures are retried by the session's adapter; max_retries
+        bounds how many times a rate-limited query is retried.
+        """
+        if not self.token_pool:
+            logger.error("The GitHub GraphQL API requires a token")
+            return None
+        if not self.use_graphql:
+            return None
+        
+        for attempt in range(max_retries):
+            try:
+                # GraphQL has its own rate limit budget, so only concurrency is
+                # shared with the REST requests here
+                token = self.token_pool.pick_token()
+                with self.rate_limiter:
+                    response = self.session.post(f"{self.base_url}/graphql",
+                                                 json={'query': query, 'variables': variables or {}},
+                                                 headers=self._auth_headers(token), timeout=30)
                 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request error on attempt {attempt + 1}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                logger.error("Max retries reached for request error")
-                return None
+                if response.status_code in (403, 429) and attempt < max_retries - 1:
+                    retry_delay = get_retry_delay(response, attempt)
+                    if retry_delay is not None:
+                        logger.warning(f"GraphQL rate limited. Pausing requests for {retry_delay} seconds before retrying...")
+                        self.rate_limiter.pause(retry_delay)
+                        self._backoff(attempt)
+                        continue
                 
-            except Exception as e:
-                logger.error(f"Unexpected error on attempt {attempt + 1}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                logger.error("Max retries reached for unexpected error")
+                if response.status_code != 200:
+                    logger.error(f"GraphQL request failed: {response.status_code} - {response.text}")
+                    return None
+                
+                result = decode_json(response.content)
+                if has_insufficient_scopes(result):
+                    # Every later query would be refused the same way
+                    logger.warning("⚠️  The token lacks the read:user or user:email scope GraphQL profile lookups need; "
+                                   "fetching profiles over REST instead")
+                    self.use_graphql = False
+                    return None
+                if result.get('errors'):
+                    logger.warning(f"GraphQL query returned errors: {result['errors']}")
+                return result.get('data')
+                
+            except requests.exceptions.RequestException as e:
+                # Raised once the adapter has used up its retries
+                logger.error(f"GraphQL request error: {e}")
                 return None
         
         return None
@@ -140,34 +480,41 @@ class GitHubContributorExtractor:
     def _load_blockchain_data(self, csv_path: str) -> List[Dict]:
         """Load blockchain data from CSV file and extract GitHub repository information"""
         blockchain_repos = []
+        seen_repos = set()  # (owner, repo) pairs already loaded, case-insensitive
+        duplicates = 0
         
         try:
             with open(csv_path, 'r', encoding='utf-8') as csvfile:
                 reader = csv.DictReader(csvfile)
                 
                 for row in reader:
-                    github_url = row.get('GitHub Repository URL', '')
-                    if github_url:
-                        # Parse GitHub URL to extract owner and repo
-                        parsed_url = urlparse(github_url)
-                        path_parts = parsed_url.path.strip('/').split('/')
+                    # Extract owner and repo from the GitHub URL
+                    match = GITHUB_REPO_URL_RE.search(row.get('GitHub Repository URL', ''))
+                    if match:
+                        owner, repo = match.groups()
+                        project_name = row.get('Project Name', f"{owner}/{repo}")
+                        
+                        # Skip repositories listed more than once
+                        repo_key = (owner.lower(), repo.lower())
+                        if repo_key in seen_repos:
+                            duplicates += 1
+                            continue
+                        seen_repos.add(repo_key)
+                        
+                        blockchain_repos.append({
+                            'owner': owner,
+                            'repo': repo,
+                            'name': project_name,
+                            'project_url': f"https://github.com/{owner}/{repo}",
+                            'layer_type': row.get('Layer Type', ''),
+                            'category': row.get('Category', ''),
+                            'purpose': row.get('Purpose/Specialization', ''),
+                            'description': row.get('Description', '')
+                        })
                         
-                        if len(path_parts) >= 2:
-                            owner = path_parts[0]
-                            repo = path_parts[1]
-                            project_name = row.get('Project Name', f"{owner}/{repo}")
-                            
-                            blockchain_repos.append({
-                                'owner': owner,
-                                'repo': repo,
-                                'name': project_name,
-                                'layer_type': row.get('Layer Type', ''),
-                                'category': row.get('Category', ''),
-                                'purpose': row.get('Purpose/Specialization', ''),
-                                'description': row.get('Description', '')
-                            })
-                            
             logger.info(f"Loaded {len(blockchain_repos)} blockchain repositories from {csv_path}")
+            if duplicates:
+                logger.info(f"Skipped {duplicates} duplicate repositories")
             return blockchain_repos
             
         except FileNotFoundError:
@@ -181,21 +528,23 @@ class GitHubContributorExtractor:
         """Get top repositories for a blockchain organization"""
         logger.info(f"🔍 Fetching top {limit} repositories for {owner}...")
         
-        # Get organization repositories
-        url = f"{self.base_url}/orgs/{owner}/repos?per_page={limit}&sort=stars&order=desc"
+        # The search API ranks all of the organization's own (non-fork)
+        # repositories by stars, so the top ones come back in a single request
+        url = f"{self.base_url}/search/repositories?q=org:{owner}+fork:false&sort=stars&order=desc&per_page={limit}"
         data = self.make_request(url)
         
-        if not data:
+        if not data or not data.get('items'):
             logger.warning(f"⚠️  No repositories found for {owner}")
             return []
         
-        if isinstance(data, list):
+        if isinstance(data['items'], list):
             repositories = []
-            for repo_data in data[:limit]:
+            for repo_data in data['items'][:limit]:
                 repositories.append({
                     'owner': owner,
                     'repo': repo_data['name'],
                     'name': repo_data['full_name'],
+                    'project_url': repo_data.get('html_url') or f"https://github.com/{repo_data['full_name']}",
                     'stars': repo_data.get('stargazers_count', 0),
                     'description': repo_data.get('description', '')
                 })
@@ -221,6 +570,13 @@ class GitHubContributorExtractor:
         if isinstance(data, list):
             # Filter for users only and take top 10
             contributors = [c for c in data if c.get('type') == 'User'][:10]
+            
+            # Skip occasional contributors before any profile is requested for them
+            relevant = [c for c in contributors if c.get('contributions', 0) >= self.min_contributions]
+            if len(relevant) < len(contributors):
+                logger.info(f"⏭️  Skipping {len(contributors) - len(relevant)} contributors "
+                            f"with fewer than {self.min_contributions} contributions")
+            contributors = relevant
             logger.info(f"✅ Found {len(contributors)} top contributors")
             
             # Show all top contributors
@@ -234,131 +590,229 @@ class GitHubContributorExtractor:
             return []
 
     def get_user_details(self, username: str) -> Optional[Dict]:
-        """Get detailed information about a user"""
+        """Get detailed information about a user (cached per username)"""
+        cached = self._get_cached_user(username)
+        if cached is not None:
+            return cached
+        
         url = f"{self.base_url}/users/{username}"
-        return self.make_request(url)
+        user_data = self.make_request(url)
+        
+        if user_data:
+            self._cache_users({username: user_data})
+        return user_data
+
+    def get_user_details_batch(self, contributors: List[Dict]) -> List[Optional[Dict]]:
+        """Get the profiles of several contributors with batched GraphQL requests
+        
+        Profiles already cached are not requested again, the rest are looked up
+        by node ID in one request per GRAPHQL_MAX_NODES users. Users GraphQL could
+        not resolve are fetched over REST. Profiles are returned in the order of
+        the contributors.
+        """
+        profiles = {}
+        for contributor in contributors:
+            cached = self._get_cached_user(contributor['login'])
+            if cached is not None:
+                profiles[contributor['login']] = cached
+        
+        pending = [c for c in contributors if c['login'] not in profiles and c.get('node_id')]
+        unresolved = [c['login'] for c in contributors if c['login'] not in profiles and not c.get('node_id')]
+        
+        for start in range(0, len(pending), GRAPHQL_MAX_NODES):
+            batch = pending[start:start + GRAPHQL_MAX_NODES]
+            data = self.graphql(USER_PROFILES_QUERY, {'ids': [c['node_id'] for c in batch]})
+            
+            if data is None:
+                logger.warning("GraphQL profile lookup failed, falling back to REST")
+                unresolved.extend(c['login'] for c in batch)
+                continue
+            
+            nodes = data.get('nodes') or [None] * len(batch)
+            fetched = {}
+            for contributor, node in zip(batch, nodes):
+                if not node:
+                    unresolved.append(contributor['login'])
+                    continue
+                fetched[contributor['login']] = graphql_user_to_rest(node)
+            self._cache_users(fetched)
+            profiles.update(fetched)
+        
+        if unresolved:
+            profiles.update(zip(unresolved, self._get_user_details_concurrently(unresolved)))
+        
+        return [profiles.get(c['login']) for c in contributors]
+
+    def _get_user_details_concurrently(self, usernames: List[str]) -> List[Optional[Dict]]:
+        """Get the profiles of several users over REST, with the requests in parallel"""
+        return list(self._request_executor.map(self.get_user_details, usernames))
 
     def extract_social_links(self, user_data: Dict) -> Dict[str, str]:
         """Extract social media links from user data"""
-        social_links = {
-            'twitter': '',
-            'linkedin': '',
-            'website': '',
-            'blog': '',
-            'location': '',
-            'company': '',
-            'bio': ''
-        }
+        if not user_data:
+            return {'twitter': '', 'linkedin': '', 'website': '', 'blog': '',
+                    'location': '', 'company': '', 'bio': ''}
         
-        if user_data:
-            social_links['twitter'] = user_data.get('twitter_username', '')
-            social_links['linkedin'] = user_data.get('blog', '') if 'linkedin.com' in user_data.get('blog', '') else ''
-            social_links['website'] = user_data.get('blog', '') if 'linkedin.com' not in user_data.get('blog', '') else ''
-            social_links['blog'] = user_data.get('blog', '')
-            social_links['location'] = user_data.get('location', '')
-            social_links['company'] = user_data.get('company', '')
-            social_links['bio'] = user_data.get('bio', '')
+        # The blog field holds either a LinkedIn profile or a personal website
+        blog = user_data.get('blog') or ''
+        is_linkedin = 'linkedin.com' in blog
         
-        return social_links
+        return {
+            'twitter': user_data.get('twitter_username') or '',
+            'linkedin': blog if is_linkedin else '',
+            'website': '' if is_linkedin else blog,
+            'blog': blog,
+            'location': user_data.get('location') or '',
+            'company': user_data.get('company') or '',
+            'bio': user_data.get('bio') or ''
+        }
 
-    def process_repository(self, repo_info: Dict) -> List[Dict]:
+    def process_repository(self, repo_info: Dict) -> List[ContributorRow]:
         """Process a single repository and extract contributor information"""
+        return self.process_repositories([repo_info])[0]
+
+    def process_repositories(self, repo_infos: List[Dict]) -> List[List[ContributorRow]]:
+        """Process several repositories and extract contributor information
+        
+        Contributor lists are fetched concurrently, then the profiles of all
+        contributors across the repositories are looked up together: in shared
+        GraphQL requests when authenticated, otherwise with concurrent REST
+        requests. Returns the rows of each repository, in the order given.
+        """
+        for repo_info in repo_infos:
+            logger.info(f"🚀 Processing {repo_info['name']} ({repo_info['owner']}/{repo_info['repo']})")
+        
+        contributor_lists = list(self._request_executor.map(
+            lambda repo_info: self.get_repo_contributors(repo_info['owner'], repo_info['repo']), repo_infos))
+        
+        # Each contributor's profile is needed once, however many repositories they appear in
+        unique_contributors = {}
+        for contributors_data in contributor_lists:
+            for contributor in contributors_data:
+                unique_contributors.setdefault(contributor['login'], contributor)
+        
+        if unique_contributors:
+            logger.info(f"📊 Found {len(unique_contributors)} top contributors. Fetching detailed profiles...")
+        
+        if self.use_graphql:
+            profiles = self.get_user_details_batch(list(unique_contributors.values()))
+        else:
+            profiles = self._get_user_details_concurrently(list(unique_contributors))
+        user_details_by_login = dict(zip(unique_contributors, profiles))
+        
+        return [self._build_contributor_rows(repo_info, contributors_data, user_details_by_login)
+                for repo_info, contributors_data in zip(repo_infos, contributor_lists)]
+
+    def _build_contributor_rows(self, repo_info: Dict, contributors_data: List[Dict],
+                                user_details_by_login: Dict[str, Optional[Dict]]) -> List[ContributorRow]:
+        """Build the output rows of a repository from its contributors and their profiles"""
         owner = repo_info['owner']
         repo = repo_info['repo']
         project_name = repo_info['name']
-        
-        logger.info(f"🚀 Processing {project_name} ({owner}/{repo})")
-        
-        contributors_data = self.get_repo_contributors(owner, repo)
+        project_url = repo_info.get('project_url') or f"https://github.com/{owner}/{repo}"
         
         if not contributors_data:
             logger.warning(f"⚠️  No contributors found for {project_name}")
             return []
         
-        logger.info(f"📊 Found {len(contributors_data)} top contributors. Fetching detailed profiles...")
-        
         results = []
         
-        for i, contributor in enumerate(contributors_data, 1):
+        for contributor in contributors_data:
             username = contributor['login']
-            logger.info(f"⏳ [{i}/{len(contributors_data)}] Fetching profile for @{username}")
-            
-            user_details = self.get_user_details(username)
+            user_details = user_details_by_login.get(username)
             
             if user_details:
-                social_links = self.extract_social_links(user_details)
-                
-                contributor_info = {
-                    'project_name': project_name,
-                    'project_url': f"https://github.com/{owner}/{repo}",
-                    'contributor_username': username,
-                    'contributor_url': user_details.get('html_url', ''),
-                    'contributor_name': user_details.get('name', ''),
-                    'contributor_email': user_details.get('email', ''),
-                    'contributions': contributor.get('contributions', 0),
-                    'twitter': social_links['twitter'],
-                    'linkedin': social_links['linkedin'],
-                    'website': social_links['website'],
-                    'blog': social_links['blog'],
-                    'location': social_links['location'],
-                    'company': social_links['company'],
-                    'bio': social_links['bio'],
-                    'followers': user_details.get('followers', 0),
-                    'following': user_details.get('following', 0),
-                    'public_repos': user_details.get('public_repos', 0),
-                    'account_created': user_details.get('created_at', ''),
-                    'last_updated': user_details.get('updated_at', '')
-                }
+                contributor_info = ContributorRow(
+                    project_name=project_name,
+                    project_url=project_url,
+                    contributor_username=username,
+                    contributor_url=user_details.get('html_url', ''),
+                    contributor_name=user_details.get('name', ''),
+                    contributor_email=user_details.get('email', ''),
+                    contributions=contributor.get('contributions', 0),
+                    **self.extract_social_links(user_details),
+                    followers=user_details.get('followers', 0),
+                    following=user_details.get('following', 0),
+                    public_repos=user_details.get('public_repos', 0),
+                    account_created=user_details.get('created_at', ''),
+                    last_updated=user_details.get('updated_at', '')
+                )
                 
                 results.append(contributor_info)
                 
                 # Show sample data for each contributor
                 self._show_sample_contributor(contributor_info)
-                
-                # Small delay to be respectful to the API
-                time.sleep(0.1)
             else:
                 logger.warning(f"⚠️  Could not fetch details for @{username}")
         
         logger.info(f"✅ Completed processing {project_name}: {len(results)} top contributor profiles extracted")
         return results
     
-    def _show_sample_contributor(self, contributor_info: Dict):
+    def _show_sample_contributor(self, contributor_info: ContributorRow):
         """Display sample contributor information"""
-        name = contributor_info.get('contributor_name', 'N/A')
-        username = contributor_info.get('contributor_username', 'N/A')
-        contributions = contributor_info.get('contributions', 0)
-        email = contributor_info.get('contributor_email', 'N/A')
-        twitter = contributor_info.get('twitter', 'N/A')
+        # Called for every contributor, so skip the work when INFO is not logged
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
-        logger.info(f"👤 Sample: {name} (@{username}) - {contributions} contributions")
+        name = contributor_info.contributor_name
+        username = contributor_info.contributor_username
+        contributions = contributor_info.contributions
+        email = contributor_info.contributor_email
+        twitter = contributor_info.twitter
+        
+        logger.info("👤 Sample: %s (@%s) - %s contributions", name, username, contributions)
         if email != 'N/A':
-            logger.info(f"   📧 Email: {email}")
+            logger.info("   📧 Email: %s", email)
         if twitter != 'N/A':
-            logger.info(f"   🐦 Twitter: @{twitter}")
+            logger.info("   🐦 Twitter: @%s", twitter)
 
-    def save_to_csv(self, data: List[Dict], filename: str):
-        """Save contributor data to CSV file"""
+    def save_to_csv(self, data: List[NamedTuple], filename: str):
+        """Save contributor rows to CSV file"""
         if not data:
             logger.warning("No data to save")
             return
         
-        # Get all unique keys from all dictionaries
-        all_keys = set()
-        for item in data:
-            all_keys.update(item.keys())
-        
-        fieldnames = sorted(all_keys)
-        
+        # Rows are tuples in column order, so they are written as-is under
+        # the header of their row type
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+            writer = csv.writer(csvfile)
+            writer.writerow(data[0]._fields)
             writer.writerows(data)
         
         logger.info(f"Data saved to {filename}")
 
-    def save_to_excel(self, data: List[Dict], filename: str):
-        """Save contributor data to Excel file"""
+    def save_to_parquet(self, data: List[NamedTuple], filename: str):
+        """Save contributor rows to a zstd-compressed Parquet file"""
+        if not data:
+            logger.warning("No data to save")
+            return
+        
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            logger.error("pyarrow required for Parquet export. Install with: pip install pyarrow")
+            # Fallback to CSV
+            self.save_to_csv(data, filename.replace('.parquet', '.csv'))
+            return
+        
+        # Column types come from the row's annotations rather than being inferred,
+        # so a column that happens to hold only None is still typed in the file
+        arrow_types = {str: pa.string(), int: pa.int64()}
+        schema = pa.schema([(name, arrow_types[annotation])
+                            for name, annotation in type(data[0]).__annotations__.items()])
+        
+        # Transpose the rows into columns and build the table directly from them.
+        # Only the repeated project and blockchain columns are dictionary-encoded;
+        # per-contributor values are nearly all distinct and are stored plain
+        columns = dict(zip(data[0]._fields, map(list, zip(*data))))
+        pq.write_table(pa.table(columns, schema=schema), filename, compression='zstd',
+                       use_dictionary=[name for name in columns if name in DICTIONARY_COLUMNS])
+        logger.info(f"Data saved to {filename}")
+
+    def save_to_excel(self, data: List[NamedTuple], filename: str):
+        """Save contributor rows to Excel file (deprecated, prefer Parquet)"""
+        logger.warning("Excel export is deprecated and slow for large datasets; use output_format='parquet' instead")
         try:
             import pandas as pd
             df = pd.DataFrame(data)
@@ -369,6 +823,43 @@ class GitHubContributorExtractor:
             # Fallback to CSV
             self.save_to_csv(data, filename.replace('.xlsx', '.csv'))
 
+    def _process_blockchain(self, blockchain_info: Dict,
+                            top_repos_future: Future) -> Optional[List[BlockchainContributorRow]]:
+        """Process the top repositories of a blockchain organization
+        
+        top_repos_future resolves to the organization's top repositories, which
+        are listed ahead of time. Returns None when the organization has no
+        repositories.
+        """
+        owner = blockchain_info['owner']
+        project_name = blockchain_info['name']
+        
+        top_repos = top_repos_future.result()
+        
+        if not top_repos:
+            logger.warning(f"⚠️  No repositories found for {owner}")
+            return None
+        
+        # Process the organization's repositories together
+        repo_results = self.process_repositories(top_repos)
+        
+        org_contributors = []
+        for repo_info, repo_contributors in zip(top_repos, repo_results):
+            # Add blockchain metadata to each contributor
+            for contributor in repo_contributors:
+                org_contributors.append(BlockchainContributorRow(
+                    *contributor,
+                    blockchain_name=project_name,
+                    blockchain_layer_type=blockchain_info.get('layer_type', ''),
+                    blockchain_category=blockchain_info.get('category', ''),
+                    blockchain_purpose=blockchain_info.get('purpose', ''),
+                    blockchain_description=blockchain_info.get('description', ''),
+                    repo_stars=repo_info.get('stars', 0),
+                    repo_description=repo_info.get('description', '')
+                ))
+        
+        return org_contributors
+
     def extract_blockchain_contributors_with_top_repos(self, output_format: str = 'csv', output_filename: str = None) -> str:
         """Extract contributors from blockchain organizations with their top repositories"""
         if output_filename is None:
@@ -379,82 +870,91 @@ class GitHubContributorExtractor:
         logger.info(f"📋 Processing {len(self.blockchain_repos)} blockchain organizations")
         logger.info(f"💾 Output will be saved to: {output_filename}")
         
-        all_contributors = []
+        # CSV output is written row by row as organizations complete, so the file
+        # is always up to date; other formats are buffered and saved at the end
+        stream_csv = output_format.lower() not in ('excel', 'parquet')
+        unique_contributors = []
+        seen = set()  # (contributor_username, project_name) pairs already collected
+        total_contributors = 0
         successful_orgs = 0
         failed_orgs = 0
         
-        for i, blockchain_info in enumerate(self.blockchain_repos, 1):
-            owner = blockchain_info['owner']
-            repo = blockchain_info['repo']
-            project_name = blockchain_info['name']
-            
-            logger.info(f"\n📁 [{i}/{len(self.blockchain_repos)}] Processing: {project_name} ({owner})")
-            logger.info("=" * 60)
+        csvfile = open(output_filename, 'w', newline='', encoding='utf-8') if stream_csv else None
+        try:
+            if csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(BLOCKCHAIN_CONTRIBUTOR_FIELDNAMES)
             
-            try:
-                # Get top 5 repositories for this blockchain organization
-                top_repos = self.get_top_repositories_for_blockchain(owner, repo, limit=5)
-                
-                if not top_repos:
-                    logger.warning(f"⚠️  No repositories found for {owner}")
-                    failed_orgs += 1
-                    continue
+            # The flow is a two-stage pipeline: each organization's top 5 repositories
+            # are listed ahead of time in their own pool, so an organization's
+            # contributors can be processed as soon as its listing is ready, while
+            # later listings are still in flight. Organizations are independent, so
+            # several are processed at once; results are consumed in the original
+            # order by this thread alone
+            with ThreadPoolExecutor(max_workers=self.max_parallel_orgs, thread_name_prefix='github-listing') as listing_executor, \
+                    ThreadPoolExecutor(max_workers=self.max_parallel_orgs) as executor:
+                listings = [listing_executor.submit(self.get_top_repositories_for_blockchain,
+                                                    blockchain_info['owner'], blockchain_info['repo'], 5)
+                            for blockchain_info in self.blockchain_repos]
+                futures = [executor.submit(self._process_blockchain, blockchain_info, listing)
+                           for blockchain_info, listing in zip(self.blockchain_repos, listings)]
                 
-                # Process each repository
-                for repo_info in top_repos:
-                    logger.info(f"🔍 Processing repository: {repo_info['name']}")
-                    repo_contributors = self.process_repository(repo_info)
+                for i, (blockchain_info, future) in enumerate(zip(self.blockchain_repos, futures), 1):
+                    owner = blockchain_info['owner']
+                    project_name = blockchain_info['name']
                     
-                    # Add blockchain metadata to each contributor
-                    for contributor in repo_contributors:
-                        contributor['blockchain_name'] = project_name
-                        contributor['blockchain_layer_type'] = blockchain_info.get('layer_type', '')
-                        contributor['blockchain_category'] = blockchain_info.get('category', '')
-                        contributor['blockchain_purpose'] = blockchain_info.get('purpose', '')
-                        contributor['blockchain_description'] = blockchain_info.get('description', '')
-                        contributor['repo_stars'] = repo_info.get('stars', 0)
-                        contributor['repo_description'] = repo_info.get('description', '')
+                    logger.info(f"\n📁 [{i}/{len(self.blockchain_repos)}] Processing: {project_name} ({owner})")
+                    logger.info("=" * 60)
                     
-                    all_contributors.extend(repo_contributors)
-                
-                successful_orgs += 1
-                
-                # Show cumulative progress
-                logger.info(f"📈 Cumulative progress: {len(all_contributors)} contributors from {successful_orgs} organizations")
-                
-                # Save intermediate progress every 3 organizations
-                if successful_orgs % 3 == 0:
-                    self.save_to_csv(all_contributors, f"intermediate_{output_filename}")
-                    logger.info(f"💾 Intermediate progress saved to intermediate_{output_filename}")
-                
-            except Exception as e:
-                failed_orgs += 1
-                logger.error(f"❌ Error processing {project_name}: {e}")
-                continue
-        
-        # Remove duplicates based on contributor username and project
-        logger.info(f"\n🔍 Removing duplicates...")
-        unique_contributors = []
-        seen = set()
-        
-        for contributor in all_contributors:
-            key = (contributor['contributor_username'], contributor['project_name'])
-            if key not in seen:
-                seen.add(key)
-                unique_contributors.append(contributor)
+                    try:
+                        org_contributors = future.result()
+                        
+                        if org_contributors is None:
+                            failed_orgs += 1
+                            continue
+                        
+                        total_contributors += len(org_contributors)
+                        successful_orgs += 1
+                        
+                        # Skip duplicates based on contributor username and project
+                        for contributor in org_contributors:
+                            key = (contributor.contributor_username, contributor.project_name)
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            
+                            if csvfile:
+                                writer.writerow(contributor)
+                            else:
+                                unique_contributors.append(contributor)
+                        
+                        if csvfile:
+                            csvfile.flush()
+                        
+                        # Show cumulative progress
+                        logger.info(f"📈 Cumulative progress: {total_contributors} contributors from {successful_orgs} organizations")
+                        
+                    except Exception as e:
+                        failed_orgs += 1
+                        logger.error(f"❌ Error processing {project_name}: {e}")
+                        continue
+        finally:
+            if csvfile:
+                csvfile.close()
         
         logger.info(f"📊 Final Statistics:")
         logger.info(f"   ✅ Successfully processed: {successful_orgs} organizations")
         logger.info(f"   ❌ Failed to process: {failed_orgs} organizations")
-        logger.info(f"   👥 Total contributors found: {len(all_contributors)}")
-        logger.info(f"   🎯 Unique contributors: {len(unique_contributors)}")
+        logger.info(f"   👥 Total contributors found: {total_contributors}")
+        logger.info(f"   🎯 Unique contributors: {len(seen)}")
+        self._log_cache_stats()
         
-        # Save to file
-        logger.info(f"\n💾 Saving final results to {output_filename}...")
         if output_format.lower() == 'excel':
+            logger.info(f"\n💾 Saving final results to {output_filename}...")
             self.save_to_excel(unique_contributors, output_filename)
-        else:
-            self.save_to_csv(unique_contributors, output_filename)
+        elif output_format.lower() == 'parquet':
+            logger.info(f"\n💾 Saving final results to {output_filename}...")
+            self.save_to_parquet(unique_contributors, output_filename)
         
         logger.info(f"🎉 Extraction completed successfully!")
         logger.info(f"📁 Final file: {output_filename}")
@@ -471,56 +971,81 @@ class GitHubContributorExtractor:
         logger.info(f"📋 Processing {len(self.blockchain_repos)} repositories")
         logger.info(f"💾 Output will be saved to: {output_filename}")
         
-        all_contributors = []
+        # CSV output is written row by row as repositories complete, so the file
+        # is always up to date; other formats are buffered and saved at the end
+        stream_csv = output_format.lower() not in ('excel', 'parquet')
+        unique_contributors = []
+        seen = set()  # (contributor_username, project_name) pairs already written
+        total_contributors = 0
         successful_repos = 0
         failed_repos = 0
         
-        for i, repo_info in enumerate(self.blockchain_repos, 1):
-            repo_name = repo_info['name']
-            logger.info(f"\n📁 [{i}/{len(self.blockchain_repos)}] Processing: {repo_name}")
-            logger.info("=" * 60)
+        csvfile = open(output_filename, 'w', newline='', encoding='utf-8') if stream_csv else None
+        try:
+            if csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(CONTRIBUTOR_FIELDNAMES)
             
-            try:
-                repo_contributors = self.process_repository(repo_info)
-                all_contributors.extend(repo_contributors)
-                successful_repos += 1
-                
-                # Show cumulative progress
-                logger.info(f"📈 Cumulative progress: {len(all_contributors)} contributors from {successful_repos} repositories")
-                
-                # Save intermediate progress every 5 repositories
-                if successful_repos % 5 == 0:
-                    self.save_to_csv(all_contributors, f"intermediate_{output_filename}")
-                    logger.info(f"💾 Intermediate progress saved to intermediate_{output_filename}")
+            # Repositories are processed in batches that share their profile
+            # lookups; batches run concurrently and are consumed in the original order
+            batches = [self.blockchain_repos[start:start + REPOS_PER_BATCH]
+                       for start in range(0, len(self.blockchain_repos), REPOS_PER_BATCH)]
+            
+            with ThreadPoolExecutor(max_workers=self.max_parallel_repos) as executor:
+                futures = [executor.submit(self.process_repositories, batch) for batch in batches]
+                i = 0
                 
-            except Exception as e:
-                failed_repos += 1
-                logger.error(f"❌ Error processing {repo_info['name']}: {e}")
-                continue
-        
-        # Remove duplicates based on contributor username and project
-        logger.info(f"\n🔍 Removing duplicates...")
-        unique_contributors = []
-        seen = set()
-        
-        for contributor in all_contributors:
-            key = (contributor['contributor_username'], contributor['project_name'])
-            if key not in seen:
-                seen.add(key)
-                unique_contributors.append(contributor)
+                for batch, future in zip(batches, futures):
+                    try:
+                        batch_results = future.result()
+                    except Exception as e:
+                        i += len(batch)
+                        failed_repos += len(batch)
+                        logger.error(f"❌ Error processing {batch[0]['name']} - {batch[-1]['name']}: {e}")
+                        continue
+                    
+                    for repo_info, repo_contributors in zip(batch, batch_results):
+                        i += 1
+                        logger.info(f"\n📁 [{i}/{len(self.blockchain_repos)}] Processed: {repo_info['name']}")
+                        logger.info("=" * 60)
+                        
+                        total_contributors += len(repo_contributors)
+                        successful_repos += 1
+                        
+                        # Skip duplicates based on contributor username and project
+                        for contributor in repo_contributors:
+                            key = (contributor.contributor_username, contributor.project_name)
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            
+                            if csvfile:
+                                writer.writerow(contributor)
+                            else:
+                                unique_contributors.append(contributor)
+                        
+                        if csvfile:
+                            csvfile.flush()
+                        
+                        # Show cumulative progress
+                        logger.info(f"📈 Cumulative progress: {total_contributors} contributors from {successful_repos} repositories")
+        finally:
+            if csvfile:
+                csvfile.close()
         
         logger.info(f"📊 Final Statistics:")
         logger.info(f"   ✅ Successfully processed: {successful_repos} repositories")
         logger.info(f"   ❌ Failed to process: {failed_repos} repositories")
-        logger.info(f"   👥 Total contributors found: {len(all_contributors)}")
-        logger.info(f"   🎯 Unique contributors: {len(unique_contributors)}")
+        logger.info(f"   👥 Total contributors found: {total_contributors}")
+        logger.info(f"   🎯 Unique contributors: {len(seen)}")
+        self._log_cache_stats()
         
-        # Save to file
-        logger.info(f"\n💾 Saving final results to {output_filename}...")
         if output_format.lower() == 'excel':
+            logger.info(f"\n💾 Saving final results to {output_filename}...")
             self.save_to_excel(unique_contributors, output_filename)
-        else:
-            self.save_to_csv(unique_contributors, output_filename)
+        elif output_format.lower() == 'parquet':
+            logger.info(f"\n💾 Saving final results to {output_filename}...")
+            self.save_to_parquet(unique_contributors, output_filename)
         
         logger.info(f"🎉 Extraction completed successfully!")
         logger.info(f"📁 Final file: {output_filename}")
@@ -529,13 +1054,25 @@ class GitHubContributorExtractor:
 
 def main():
     """Main function to run the contributor extraction"""
-    # Check for GitHub token
+    # Check for GitHub tokens; GITHUB_TOKENS takes a comma-separated list
+    # whose requests are rotated over, each token adding its own rate limit
     token = os.getenv('GITHUB_TOKEN')
-    if not token:
+    tokens = [t.strip() for t in os.getenv('GITHUB_TOKENS', '').split(',') if t.strip()]
+    if not token and not tokens:
         logger.warning("No GITHUB_TOKEN found in environment variables. Using unauthenticated requests (lower rate limits)")
+    elif tokens:
+        logger.info(f"Rotating requests over {len(tokens)} GitHub tokens")
     
-    # Create extractor instance with blockchain CSV data
-    extractor = GitHubContributorExtractor(token, blockchain_csv_path='evm_blockchains.csv')
+    # Create extractor instance with blockchain CSV data; concurrency and the
+    # request rate can be tuned through the environment
+    extractor = GitHubContributorExtractor(
+        token,
+        blockchain_csv_path='evm_blockchains.csv',
+        tokens=tokens,
+        max_concurrent_requests=int(os.getenv('GH_CONCURRENCY', '8')),
+        max_requests_per_minute=int(os.getenv('GH_REQUESTS_PER_MINUTE', '80')) or None,
+        min_contributions=int(os.getenv('GH_MIN_CONTRIBUTIONS', str(MIN_CONTRIBUTIONS)))
+    )
     
     # Extract contributors using the new method with top repositories
     logger.info("🚀 Starting blockchain contributors extraction with top repositories...")
@@ -543,6 +1080,7 @@ def main():
         output_format='csv'
         # output_filename will be auto-generated with timestamp
     )
+    extractor.close()
     
     print(f"🎉 Blockchain contributors extraction completed!")
     print(f"📁 Output file: {output_file}")
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Shared GitHub API helpers
+Token rotation, the SQLite response and profile cache, and the GraphQL profile
+lookup used by both contributor extractors
+"""
+
+import json
+import time
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Any
+import logging
+
+import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+def decode_json(content) -> Any:
+    """Decode a JSON document, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def encode_json(data: Any) -> str:
+    """Encode data as a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data)
+
+def is_core_rate_limit(headers) -> bool:
+    """Whether the X-RateLimit-* headers of a response are those of the REST budget
+    
+    The search API has a much smaller budget of its own, which must not pace
+    or exhaust the REST requests.
+    """
+    return headers.get('X-RateLimit-Resource', 'core') == 'core'
+
+# Seconds GitHub asks to wait after a secondary rate limit, doubled on every retry
+SECONDARY_RATE_LIMIT_DELAY = 60
+
+def get_retry_delay(response: requests.Response, attempt: int = 0) -> Optional[int]:
+    """Return how long to wait before retrying a 403/429 response, or None if retrying cannot help
+    
+    Retry-After is honored as given, and an exhausted budget is waited out until
+    its reset. A 429, or a 403 whose message names a rate limit, is a secondary
+    rate limit and is waited out for a minute, doubled on every retry. Any other
+    403 (SAML enforcement, a contributor list too large to list, missing
+    permissions) fails the same way on every retry.
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is not None:
+        return int(retry_after)
+    if response.headers.get('X-RateLimit-Remaining') == '0':
+        return max(0, int(response.headers.get('X-RateLimit-Reset', 0)) - int(time.time()))
+    message = response.text.lower()
+    if response.status_code == 429 or 'rate limit' in message or 'abuse' in message:
+        return SECONDARY_RATE_LIMIT_DELAY * 2 ** attempt
+    return None
+
+# Seconds a user profile stored in the cache is reused before it is fetched again
+PROFILE_CACHE_TTL = 24 * 60 * 60
+
+# Profile fields fetched for a batch of users by their GraphQL node IDs
+USER_PROFILES_QUERY = '''
+query($ids: [ID!]!) {
+  nodes(ids: $ids) {
+    ... on User {
+      login name email bio company location twitterUsername websiteUrl url createdAt updatedAt
+      followers { totalCount }
+      following { totalCount }
+      repositories(ownerAffiliations: OWNER, privacy: PUBLIC) { totalCount }
+    }
+  }
+}
+'''
+
+# Maximum number of IDs GitHub accepts in a single nodes() lookup
+GRAPHQL_MAX_NODES = 100
+
+# Version of the profile shape stored in the cache file; bump it whenever the
+# fields of USER_PROFILES_QUERY or graphql_user_to_rest change
+PROFILE_SCHEMA_VERSION = 1
+
+def has_insufficient_scopes(result: Dict) -> bool:
+    """Whether a GraphQL response was refused because the token lacks a scope
+    
+    Reading a user's email needs the read:user or user:email scope, which a
+    token made for public_repo alone does not have.
+    """
+    return any(error.get('type') == 'INSUFFICIENT_SCOPES' for error in result.get('errors') or [])
+
+def graphql_user_to_rest(node: Dict) -> Dict:
+    """Convert a GraphQL User node to the shape of a REST /users/{username} response"""
+    return {
+        'login': node['login'],
+        'html_url': node.get('url', ''),
+        'name': node.get('name'),
+        'email': node.get('email') or None,
+        'bio': node.get('bio'),
+        'company': node.get('company'),
+        'location': node.get('location'),
+        'twitter_username': node.get('twitterUsername'),
+        'blog': node.get('websiteUrl') or '',
+        'followers': node['followers']['totalCount'],
+        'following': node['following']['totalCount'],
+        'public_repos': node['repositories']['totalCount'],
+        'created_at': node.get('createdAt', ''),
+        'updated_at': node.get('updatedAt', '')
+    }
+
+class GitHubTokenPool:
+    """
+    Rotates requests over several GitHub tokens, each with its own rate limit
+    
+    Every token's budget is tracked from the X-RateLimit-* headers of the
+    responses to its requests. Requests go to the token with the most budget
+    left, so exhausted tokens are skipped until their window resets.
+    """
+
+    def __init__(self, tokens: List[str]):
+        self.tokens = list(dict.fromkeys(tokens))
+        self._remaining = {token: 5000 for token in self.tokens}
+        self._reset = {token: 0 for token in self.tokens}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def _effective_remaining(self, token: str, now: float) -> int:
+        """Budget of a token, treating a window that has reset as a full one"""
+        if self._reset[token] and self._reset[token] <= now:
+            return 5000
+        return self._remaining[token]
+
+    def pick_token(self) -> Optional[str]:
+        """Return the token with the most budget left, or None for an empty pool"""
+        if not self.tokens:
+            return None
+        now = time.time()
+        with self._lock:
+            return max(self.tokens, key=lambda token: self._effective_remaining(token, now))
+
+    def update(self, token: str, headers):
+        """Update a token's budget from the rate limit headers of a response to it"""
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        with self._lock:
+            if remaining is not None:
+                self._remaining[token] = int(remaining)
+            if reset is not None:
+                self._reset[token] = int(reset)
+
+    def budget(self) -> tuple:
+        """Return the budget left across all tokens and when the next window resets"""
+        now = time.time()
+        with self._lock:
+            remaining = sum(self._effective_remaining(token, now) for token in self.tokens)
+            resets = [reset for reset in self._reset.values() if reset > now]
+        return remaining, min(resets) if resets else None
+
+class GitHubCache:
+    """
+    SQLite file holding response bodies by URL and user profiles by login
+    
+    Responses are stored with their ETag so they can be revalidated with
+    conditional requests; profiles are stored with the time they were fetched
+    and reused while fresh. The file's user_version records the profile shape
+    stored in it, and profiles of any other shape are discarded on open. A
+    single connection is shared by all threads.
+    """
+
+    def __init__(self, db: sqlite3.Connection):
+        self._db = db
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, cache_path: str) -> Optional['GitHubCache']:
+        """Open (or create) the cache file, or return None if it cannot be used"""
+        try:
+            db = sqlite3.connect(cache_path, check_same_thread=False)
+            db.execute('CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, etag TEXT NOT NULL, body TEXT NOT NULL)')
+            
+            # Profiles stored by another version may lack fields, so they are refetched
+            if db.execute('PRAGMA user_version').fetchone()[0] != PROFILE_SCHEMA_VERSION:
+                if db.execute("SELECT 1 FROM sqlite_master WHERE name = 'profiles'").fetchone():
+                    logger.info(f"Discarding profiles cached by another version in {cache_path}")
+                    db.execute('DROP TABLE profiles')
+                db.execute(f'PRAGMA user_version = {PROFILE_SCHEMA_VERSION}')
+            db.execute('CREATE TABLE IF NOT EXISTS profiles (login TEXT PRIMARY KEY, body TEXT NOT NULL, fetched_at REAL NOT NULL)')
+            db.commit()
+            return cls(db)
+        except sqlite3.Error as e:
+            logger.error(f"Could not open response cache {cache_path}: {e}")
+            return None
+
+    def get_response(self, url: str) -> Optional[tuple]:
+        """Return the cached (etag, data) pair for a URL, if any"""
+        with self._lock:
+            row = self._db.execute('SELECT etag, body FROM responses WHERE url = ?', (url,)).fetchone()
+        if row is None:
+            return None
+        return row[0], decode_json(row[1])
+
+    def store_response(self, url: str, etag: str, data: Any):
+        """Store the ETag and decoded body of a successful response"""
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO responses (url, etag, body) VALUES (?, ?, ?)',
+                             (url, etag, encode_json(data)))
+            self._db.commit()
+
+    def get_profiles(self, usernames: List[str], ttl: float) -> Dict[str, Dict]:
+        """Return the stored profiles among usernames fetched less than ttl seconds ago"""
+        if not usernames:
+            return {}
+        
+        # All profiles are looked up in a single query
+        placeholders = ', '.join('?' * len(usernames))
+        with self._lock:
+            rows = self._db.execute(f'SELECT login, body FROM profiles WHERE login IN ({placeholders}) AND fetched_at >= ?',
+                                    (*usernames, time.time() - ttl)).fetchall()
+        return {login: decode_json(body) for login, body in rows}
+
+    def store_profiles(self, profiles: Dict[str, Dict]):
+        """Store user profiles, stamped with the current time"""
+        fetched_at = time.time()
+        with self._lock:
+            self._db.executemany('INSERT OR REPLACE INTO profiles (login, body, fetched_at) VALUES (?, ?, ?)',
+                                 [(username, encode_json(user_data), fetched_at)
+                                  for username, user_data in profiles.items()])
+            self._db.commit()
+
+    def close(self):
+        """Close the cache file"""
+        with self._lock:
+            self._db.close()
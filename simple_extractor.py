@@ -5,62 +5,325 @@ A more robust version with better rate limit management
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import csv
+import gzip
 import time
 import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional
 import logging
-from urllib.parse import urlparse
+
+from github_client import (PROFILE_CACHE_TTL, USER_PROFILES_QUERY, GitHubCache, GitHubTokenPool,
+                           decode_json, encode_json, get_retry_delay, graphql_user_to_rest, has_insufficient_scopes,
+                           is_core_rate_limit)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Repositories analyzed per blockchain: its organization's top repositories, the
+# repository its CSV row names, or both
+EXTRACTION_STRATEGIES = ('top-repos', 'csv-repo', 'both')
+
+# Requests allowed in flight at once, across all threads; GitHub's secondary
+# rate limits answer larger bursts of concurrent requests with 403s
+MAX_IN_FLIGHT_REQUESTS = 10
+
+# Owner and repository name of a GitHub repository URL
+GITHUB_REPO_URL_RE = re.compile(r'github\.com/([^/?#]+)/([^/?#]+)')
+
+class ContributorRow(NamedTuple):
+    """A contributor of a repository, one output row (fields in column order)"""
+    project_name: str
+    project_url: str
+    contributor_username: str
+    contributor_url: str
+    contributor_name: str
+    contributor_email: str
+    contributions: int
+    twitter: str
+    website: str
+    location: str
+    company: str
+    followers: int
+    following: int
+    public_repos: int
+    account_created: str
+    last_updated: str
+
+class BlockchainContributorRow(NamedTuple):
+    """A ContributorRow extended with the metadata of its blockchain and repository"""
+    project_name: str
+    project_url: str
+    contributor_username: str
+    contributor_url: str
+    contributor_name: str
+    contributor_email: str
+    contributions: int
+    twitter: str
+    website: str
+    location: str
+    company: str
+    followers: int
+    following: int
+    public_repos: int
+    account_created: str
+    last_updated: str
+    blockchain_name: str
+    blockchain_layer_type: str
+    blockchain_category: str
+    blockchain_purpose: str
+    blockchain_description: str
+    repo_stars: int
+    repo_description: str
+
+# CSV columns of a contributor, in output order
+CONTRIBUTOR_FIELDNAMES = ContributorRow._fields
+
+# CSV columns of a contributor with the metadata of its blockchain and repository
+BLOCKCHAIN_CONTRIBUTOR_FIELDNAMES = BlockchainContributorRow._fields
+
+class TokenBucket:
+    """
+    Paces requests shared by any number of threads
+    
+    Tokens accrue at rate per second up to capacity, so short bursts go out
+    immediately while the sustained rate stays bounded. A caller that finds the
+    bucket empty reserves the next token under the lock and sleeps outside it.
+    """
+
+    def __init__(self, rate: float = 1.4, capacity: int = 10):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add the tokens accrued since the last update (called with the lock held)"""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def set_rate(self, rate: float):
+        """Change the refill rate, keeping the tokens accrued at the old one"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def acquire(self):
+        """Take a token, sleeping until one is available"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
+
 class SimpleGitHubExtractor:
-    def __init__(self, token: Optional[str] = None, blockchain_csv_path: str = 'evm_blockchains.csv'):
-        """Initialize the extractor with optional GitHub token and blockchain CSV data"""
+    def __init__(self, token: Optional[str] = None, blockchain_csv_path: str = 'evm_blockchains.csv',
+                 max_workers: int = 8, cache_path: Optional[str] = 'github_cache.sqlite',
+                 profile_cache_ttl: int = PROFILE_CACHE_TTL, tokens: Optional[List[str]] = None,
+                 max_in_flight: int = MAX_IN_FLIGHT_REQUESTS):
+        """Initialize the extractor with optional GitHub token and blockchain CSV data
+        
+        Repositories are processed by up to max_workers threads, and profile
+        lookups are fanned out over as many; all of them share the request pacing,
+        and at most max_in_flight of their requests are sent at once.
+        Responses are stored with their ETags in the SQLite file at cache_path
+        (None disables it) and revalidated with conditional requests; user
+        profiles are also stored there and reused for profile_cache_ttl seconds
+        without any request. Passing several tokens rotates requests over them,
+        each adding its own rate limit budget.
+        """
         self.token = token
+        self.token_pool = GitHubTokenPool(tokens or ([token] if token else []))
+        # GraphQL needs a token, and is turned off when the token lacks the
+        # scope its profile lookups need
+        self.use_graphql = bool(self.token_pool)
         self.session = requests.Session()
         self.session.headers.update({
             'Accept': 'application/vnd.github.v3+json',
             'User-Agent': 'Blockchain-Contributors-Extractor'
         })
-        if token:
-            self.session.headers['Authorization'] = f'token {token}'
+        # Connection errors, timeouts and 5xx responses are retried by the
+        # adapter with exponential backoff; Retry-After is not honored here, so
+        # rate-limited responses always reach make_request, which pauses every thread
+        retry = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504],
+                      allowed_methods=['GET'], raise_on_status=False, respect_retry_after_header=False)
+        # The keep-alive pool holds a connection per request allowed in flight
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=max_in_flight, max_retries=retry))
         
         self.base_url = 'https://api.github.com'
-        self.last_request_time = 0
-        self.min_delay = 2.0  # Increased minimum delay between requests to avoid rate limits
+        self.max_workers = max_workers
+        # Profile lookups run in a long-lived pool; its tasks never submit further
+        # work, so repository workers can wait on it without deadlocking
+        self._profile_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='github-profile')
+        
+        # Requests from all threads draw from one token bucket, whose rate is
+        # retuned so the remaining budget lasts until the rate limit window resets
+        self.bucket = TokenBucket()
+        self._rate_limit_lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        
+        # Rate limit budget, taken from the X-RateLimit-* headers of each response
+        self.rate_limit_remaining = 60
+        self.rate_limit_reset = 0
+        self.request_count = 0
+        # Monotonic time until which a Retry-After response has paused all requests
+        self._paused_until = 0.0
+        
+        # Profiles already fetched during this run, keyed by username, and the
+        # lookups in flight, which concurrent callers wait on instead of repeating
+        self._user_cache: Dict[str, Dict] = {}
+        self._user_requests: Dict[str, Future] = {}
+        self._user_cache_lock = threading.Lock()
+        
+        # Persistent ETag cache so unchanged resources come back as 304 Not Modified,
+        # which GitHub does not count against the rate limit
+        self.profile_cache_ttl = profile_cache_ttl
+        self._cache = GitHubCache.open(cache_path) if cache_path else None
         
         # Load blockchain data from CSV file
         self.blockchain_repos = self._load_blockchain_data(blockchain_csv_path)
 
     def respect_rate_limit(self):
-        """Ensure we don't make requests too quickly"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.min_delay:
-            sleep_time = self.min_delay - time_since_last_request
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        """Ensure we don't make requests too quickly, and wait for the reset once the budget is spent"""
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            time.sleep(pause)
+        
+        if self.rate_limit_remaining <= 1:
+            wait_time = self.rate_limit_reset - time.time()
+            if wait_time > 0:
+                logger.warning(f"Rate limit budget spent. Waiting {wait_time:.0f} seconds for the reset...")
+                time.sleep(wait_time)
+        
+        self.bucket.acquire()
+        with self._rate_limit_lock:
+            self.request_count += 1
+            request_count = self.request_count
+        
+        # Report progress against the budget every 100 requests
+        if request_count % 100 == 0:
+            logger.info(f"📡 {request_count} requests made, {self.rate_limit_remaining} remaining in the rate limit window")
+
+    def _get_cached_users(self, usernames: List[str]) -> Dict[str, Dict]:
+        """Return the profiles among usernames fetched during this run, or stored by a recent one"""
+        with self._user_cache_lock:
+            profiles = {username: self._user_cache[username] for username in usernames if username in self._user_cache}
+        missing = [username for username in usernames if username not in profiles]
+        if not missing or self._cache is None:
+            return profiles
+        
+        stored = self._cache.get_profiles(missing, self.profile_cache_ttl)
+        with self._user_cache_lock:
+            self._user_cache.update(stored)
+        profiles.update(stored)
+        return profiles
+
+    def _cache_users(self, profiles: Dict[str, Dict]):
+        """Remember user profiles for the rest of the run and store them for later runs"""
+        if not profiles:
+            return
+        with self._user_cache_lock:
+            self._user_cache.update(profiles)
+        if self._cache is not None:
+            self._cache.store_profiles(profiles)
+
+    def close(self):
+        """Release the worker threads, the HTTP session and the response cache"""
+        self._profile_executor.shutdown()
+        self.session.close()
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+    def _pause(self, seconds: float):
+        """Hold back requests from all threads for the given number of seconds"""
+        with self._rate_limit_lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _auth_headers(self, token: Optional[str]) -> Dict[str, str]:
+        """Return the Authorization header for a token, if there is one"""
+        return {'Authorization': f'token {token}'} if token else {}
+
+    def _update_rate_limit(self, token: Optional[str], headers):
+        """Update the rate limit budget from the headers of a response to a request made with token
+        
+        With tokens, the budget is the one left across all of them; it is spread
+        evenly over the rest of the window. Search responses are left out, as
+        their budget is a separate one.
+        """
+        if not is_core_rate_limit(headers):
+            return
+        if token is None:
+            remaining = headers.get('X-RateLimit-Remaining')
+            reset = headers.get('X-RateLimit-Reset')
+        else:
+            self.token_pool.update(token, headers)
+            remaining, reset = self.token_pool.budget()
+        with self._rate_limit_lock:
+            if remaining is not None:
+                self.rate_limit_remaining = int(remaining)
+            if reset is not None:
+                self.rate_limit_reset = int(reset)
+            seconds_left = self.rate_limit_reset - time.time()
+            rate_limit_remaining = self.rate_limit_remaining
+        
+        if seconds_left > 0:
+            self.bucket.set_rate(max(rate_limit_remaining, 1) / seconds_left)
 
     def make_request(self, url: str, max_retries: int = 3) -> Optional[Dict]:
-        """Make a request with retry logic and rate limiting"""
+        """Make a request with retry logic and rate limiting
+        
+        Transient failures are retried by the session's adapter; max_retries
+        bounds how many times a rate-limited request is waited out and retried.
+        """
         self.respect_rate_limit()
         
+        # Revalidate cached resources with If-None-Match instead of downloading them again
+        cached = self._cache.get_response(url) if self._cache is not None else None
+        
         for attempt in range(max_retries):
             try:
-                response = self.session.get(url, timeout=30)
+                # Each attempt goes out with the token that has the most budget left
+                token = self.token_pool.pick_token()
+                request_headers = self._auth_headers(token)
+                if cached:
+                    request_headers['If-None-Match'] = cached[0]
+                with self._in_flight:
+                    response = self.session.get(url, headers=request_headers, timeout=30)
+                self._update_rate_limit(token, response.headers)
                 
-                # Check for rate limiting
-                if response.status_code == 403:
-                    reset_time = int(response.headers.get('X-RateLimit-Reset', time.time() + 60))
-                    wait_time = max(60, reset_time - int(time.time()))
-                    logger.warning(f"Rate limited. Waiting {wait_time} seconds...")
-                    time.sleep(wait_time)
+                if response.status_code == 304 and cached:
+                    return cached[1]
+                
+                # Rate limited: wait as long as GitHub asks (Retry-After, until the
+                # budget resets, or a minute and more for a secondary rate limit),
+                # pausing the other threads too, then retry
+                if response.status_code in (403, 429):
+                    retry_delay = get_retry_delay(response, attempt)
+                    if retry_delay is None:
+                        logger.warning(f"Access forbidden: {url} - {response.text}")
+                        return None
+                    if attempt == max_retries - 1:
+                        logger.warning(f"Rate limit exceeded: {url}")
+                        return None
+                    if (response.headers.get('X-RateLimit-Remaining') == '0' and 'Retry-After' not in response.headers
+                            and is_core_rate_limit(response.headers) and self.rate_limit_remaining > 0):
+                        # Only this token is exhausted; retry with another one, still
+                        # going through the pacing
+                        self.respect_rate_limit()
+                        continue
+                    logger.warning(f"Rate limited. Waiting {retry_delay} seconds...")
+                    self._pause(retry_delay)
+                    self.respect_rate_limit()
                     continue
                 
                 if response.status_code == 404:
@@ -69,32 +332,24 @@ class SimpleGitHubExtractor:
                 
                 if response.status_code != 200:
                     logger.warning(f"Request failed: {response.status_code}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                        continue
                     return None
                 
-                return response.json()
+                data = decode_json(response.content)
+                etag = response.headers.get('ETag')
+                if etag and self._cache is not None:
+                    self._cache.store_response(url, etag, data)
+                return data
                 
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL error on attempt {attempt + 1}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
+                logger.error(f"SSL error: {e}")
                 return None
                 
             except requests.exceptions.RequestException as e:
-                logger.error(f"Request error on attempt {attempt + 1}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
+                logger.error(f"Request error: {e}")
                 return None
                 
             except Exception as e:
-                logger.error(f"Unexpected error on attempt {attempt + 1}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
+                logger.error(f"Unexpected error: {e}")
                 return None
         
         return None
@@ -102,34 +357,40 @@ class SimpleGitHubExtractor:
     def _load_blockchain_data(self, csv_path: str) -> List[Dict]:
         """Load blockchain data from CSV file and extract GitHub repository information"""
         blockchain_repos = []
+        seen_repos = set()  # (owner, repo) pairs already loaded, case-insensitive
+        duplicates = 0
         
         try:
             with open(csv_path, 'r', encoding='utf-8') as csvfile:
                 reader = csv.DictReader(csvfile)
                 
                 for row in reader:
-                    github_url = row.get('GitHub Repository URL', '')
-                    if github_url:
-                        # Parse GitHub URL to extract owner and repo
-                        parsed_url = urlparse(github_url)
-                        path_parts = parsed_url.path.strip('/').split('/')
+                    # Extract owner and repo from the GitHub URL
+                    match = GITHUB_REPO_URL_RE.search(row.get('GitHub Repository URL', ''))
+                    if match:
+                        owner, repo = match.groups()
+                        project_name = row.get('Project Name', f"{owner}/{repo}")
+                        
+                        # Skip repositories listed more than once
+                        repo_key = (owner.lower(), repo.lower())
+                        if repo_key in seen_repos:
+                            duplicates += 1
+                            continue
+                        seen_repos.add(repo_key)
+                        
+                        blockchain_repos.append({
+                            'owner': owner,
+                            'repo': repo,
+                            'name': project_name,
+                            'layer_type': row.get('Layer Type', ''),
+                            'category': row.get('Category', ''),
+                            'purpose': row.get('Purpose/Specialization', ''),
+                            'description': row.get('Description', '')
+                        })
                         
-                        if len(path_parts) >= 2:
-                            owner = path_parts[0]
-                            repo = path_parts[1]
-                            project_name = row.get('Project Name', f"{owner}/{repo}")
-                            
-                            blockchain_repos.append({
-                                'owner': owner,
-                                'repo': repo,
-                                'name': project_name,
-                                'layer_type': row.get('Layer Type', ''),
-                                'category': row.get('Category', ''),
-                                'purpose': row.get('Purpose/Specialization', ''),
-                                'description': row.get('Description', '')
-                            })
-                            
             logger.info(f"Loaded {len(blockchain_repos)} blockchain repositories from {csv_path}")
+            if duplicates:
+                logger.info(f"Skipped {duplicates} duplicate repositories")
             return blockchain_repos
             
         except FileNotFoundError:
@@ -139,40 +400,70 @@ class SimpleGitHubExtractor:
             logger.error(f"Error loading blockchain data from {csv_path}: {e}")
             return []
 
-    def get_top_repositories_for_blockchain(self, owner: str, repo: str, limit: int = 5) -> List[Dict]:
-        """Get top repositories for a blockchain organization"""
+    def get_top_repositories_for_blockchain(self, owner: str, repo: str, limit: int = 5,
+                                            include_repo: bool = False) -> List[Dict]:
+        """Get top repositories for a blockchain organization
+        
+        With include_repo, the repository named for the blockchain comes first
+        when it is not among the top ones.
+        """
         logger.info(f"🔍 Fetching top {limit} repositories for {owner}...")
         
-        # Get organization repositories
-        url = f"{self.base_url}/orgs/{owner}/repos?per_page={limit}&sort=stars&order=desc"
+        # The search API ranks all of the organization's own (non-fork)
+        # repositories by stars, so the top ones come back in a single request
+        url = f"{self.base_url}/search/repositories?q=org:{owner}+fork:false&sort=stars&order=desc&per_page={limit}"
         data = self.make_request(url)
         
-        if not data:
-            logger.warning(f"⚠️  No repositories found for {owner}")
+        if data and not isinstance(data.get('items'), list):
+            logger.error(f"❌ Unexpected data format received")
             return []
         
-        if isinstance(data, list):
-            repositories = []
-            for repo_data in data[:limit]:
-                repositories.append({
-                    'owner': owner,
-                    'repo': repo_data['name'],
-                    'name': repo_data['full_name'],
-                    'stars': repo_data.get('stargazers_count', 0),
-                    'description': repo_data.get('description', '')
-                })
-            
-            logger.info(f"✅ Found {len(repositories)} top repositories for {owner}")
-            return repositories
-        else:
-            logger.error(f"❌ Unexpected data format received")
+        top_repos = (data or {}).get('items', [])[:limit]
+        
+        if include_repo and not any(repo_data['name'].lower() == repo.lower() for repo_data in top_repos):
+            pinned = self.make_request(f"{self.base_url}/repos/{owner}/{repo}")
+            if pinned:
+                top_repos.insert(0, pinned)
+        
+        if not top_repos:
+            logger.warning(f"⚠️  No repositories found for {owner}")
             return []
+        
+        repositories = [self._repository_info(owner, repo_data) for repo_data in top_repos]
+        
+        logger.info(f"✅ Found {len(repositories)} top repositories for {owner}")
+        return repositories
+
+    def get_csv_repository(self, owner: str, repo: str) -> List[Dict]:
+        """Get the repository a blockchain's CSV row names, in the shape of get_top_repositories_for_blockchain"""
+        logger.info(f"🔍 Fetching {owner}/{repo}...")
+        
+        repo_data = self.make_request(f"{self.base_url}/repos/{owner}/{repo}")
+        if not isinstance(repo_data, dict):
+            # Its contributors are still extracted, only the repository metadata is missing
+            logger.warning(f"⚠️  Could not fetch details for {owner}/{repo}")
+            repo_data = {'name': repo, 'full_name': f"{owner}/{repo}"}
+        
+        return [self._repository_info(owner, repo_data)]
+
+    def _repository_info(self, owner: str, repo_data: Dict) -> Dict:
+        """Convert a REST repository to the repository info used by the extraction"""
+        return {
+            'owner': owner,
+            'repo': repo_data['name'],
+            'name': repo_data['full_name'],
+            'stars': repo_data.get('stargazers_count', 0),
+            'description': repo_data.get('description', '')
+        }
 
     def get_top_contributors(self, owner: str, repo: str, max_contributors: int = 3) -> List[Dict]:
         """Get top contributors for a repository"""
         logger.info(f"🔍 Fetching top {max_contributors} contributors from {owner}/{repo}...")
         
-        url = f"{self.base_url}/repos/{owner}/{repo}/contributors?per_page={max_contributors}"
+        # Bots share the page with users, so ask for twice as many to still end
+        # up with max_contributors real users from the one request
+        per_page = min(max_contributors * 2, 100)
+        url = f"{self.base_url}/repos/{owner}/{repo}/contributors?per_page={per_page}&anon=false"
         data = self.make_request(url)
         
         if not data or not isinstance(data, list):
@@ -190,12 +481,96 @@ class SimpleGitHubExtractor:
         
         return contributors
 
+    def graphql(self, query: str, variables: Optional[Dict] = None) -> Optional[Dict]:
+        """Run a GitHub GraphQL query and return its data (requires a token)"""
+        if not self.use_graphql:
+            return None
+        self.respect_rate_limit()
+        
+        # GraphQL has its own rate limit budget, so its headers are not fed into
+        # the REST budget that paces the requests
+        token = self.token_pool.pick_token()
+        try:
+            with self._in_flight:
+                response = self.session.post(f"{self.base_url}/graphql", headers=self._auth_headers(token),
+                                             json={'query': query, 'variables': variables or {}}, timeout=30)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"GraphQL request error: {e}")
+            return None
+        
+        if response.status_code != 200:
+            logger.warning(f"GraphQL request failed: {response.status_code}")
+            return None
+        
+        result = decode_json(response.content)
+        if has_insufficient_scopes(result):
+            # Every later query would be refused the same way
+            logger.warning("⚠️  The token lacks the read:user or user:email scope GraphQL profile lookups need; "
+                           "fetching profiles over REST instead")
+            self.use_graphql = False
+            return None
+        if result.get('errors'):
+            logger.warning(f"GraphQL query returned errors: {result['errors']}")
+        return result.get('data')
+
+    def get_user_infos(self, contributors: List[Dict]) -> List[Optional[Dict]]:
+        """Get the profiles of several contributors, in contributor order
+        
+        Cached profiles are checked for all contributors at once and need no
+        request. With a token, the others are looked up by node ID in one
+        GraphQL request; the rest, or all of them without a token, are fetched
+        over REST in parallel.
+        """
+        profiles = self._get_cached_users([c['login'] for c in contributors])
+        
+        pending = [c for c in contributors if c['login'] not in profiles and c.get('node_id')]
+        data = self.graphql(USER_PROFILES_QUERY, {'ids': [c['node_id'] for c in pending]}) if pending else None
+        
+        if data is not None:
+            fetched = {contributor['login']: graphql_user_to_rest(node)
+                       for contributor, node in zip(pending, data.get('nodes') or []) if node}
+            self._cache_users(fetched)
+            profiles.update(fetched)
+        
+        unresolved = [c['login'] for c in contributors if c['login'] not in profiles]
+        profiles.update(zip(unresolved, self._profile_executor.map(self.get_user_info, unresolved)))
+        
+        return [profiles.get(c['login']) for c in contributors]
+
     def get_user_info(self, username: str) -> Optional[Dict]:
-        """Get user information"""
-        url = f"{self.base_url}/users/{username}"
-        return self.make_request(url)
+        """Get user information (requested at most once at a time per username, and cached)"""
+        cached = self._get_cached_users([username]).get(username)
+        if cached is not None:
+            return cached
+        
+        with self._user_cache_lock:
+            cached = self._user_cache.get(username)
+            if cached is not None:
+                return cached
+            request = self._user_requests.get(username)
+            in_flight = request is not None
+            if not in_flight:
+                request = self._user_requests[username] = Future()
+        
+        # Another repository is already fetching this contributor
+        if in_flight:
+            return request.result()
+        
+        user_info = None
+        try:
+            url = f"{self.base_url}/users/{username}"
+            user_info = self.make_request(url)
+        finally:
+            # The profile is cached before the lookup is retired, so later
+            # callers find one or the other
+            if user_info:
+                self._cache_users({username: user_info})
+            with self._user_cache_lock:
+                del self._user_requests[username]
+            request.set_result(user_info)
+        return user_info
 
-    def extract_contributors_data(self, repo_info: Dict, max_contributors: int = 10) -> List[Dict]:
+    def extract_contributors_data(self, repo_info: Dict, max_contributors: int = 10) -> List[ContributorRow]:
         """Extract contributor data for a single repository"""
         owner = repo_info['owner']
         repo = repo_info['repo']
@@ -211,217 +586,351 @@ class SimpleGitHubExtractor:
         
         logger.info(f"📊 Found {len(contributors_data)} top contributors. Fetching detailed profiles...")
         
+        # Profiles are fetched together and returned in contributor order
+        user_infos = self.get_user_infos(contributors_data)
+        
         results = []
         
-        for i, contributor in enumerate(contributors_data, 1):
+        for contributor, user_info in zip(contributors_data, user_infos):
             username = contributor['login']
-            logger.info(f"⏳ [{i}/{len(contributors_data)}] Fetching profile for @{username}")
-            
-            user_info = self.get_user_info(username)
             
             if user_info:
-                contributor_data = {
-                    'project_name': project_name,
-                    'project_url': f"https://github.com/{owner}/{repo}",
-                    'contributor_username': username,
-                    'contributor_url': user_info.get('html_url', ''),
-                    'contributor_name': user_info.get('name', ''),
-                    'contributor_email': user_info.get('email', ''),
-                    'contributions': contributor.get('contributions', 0),
-                    'twitter': user_info.get('twitter_username', ''),
-                    'website': user_info.get('blog', ''),
-                    'location': user_info.get('location', ''),
-                    'company': user_info.get('company', ''),
-                        'followers': user_info.get('followers', 0),
-                        'following': user_info.get('following', 0),
-                        'public_repos': user_info.get('public_repos', 0),
-                        'account_created': user_info.get('created_at', ''),
-                        'last_updated': user_info.get('updated_at', '')
-                }
+                contributor_data = ContributorRow(
+                    project_name=project_name,
+                    project_url=f"https://github.com/{owner}/{repo}",
+                    contributor_username=username,
+                    contributor_url=user_info.get('html_url', ''),
+                    contributor_name=user_info.get('name', ''),
+                    contributor_email=user_info.get('email', ''),
+                    contributions=contributor.get('contributions', 0),
+                    twitter=user_info.get('twitter_username', ''),
+                    website=user_info.get('blog', ''),
+                    location=user_info.get('location', ''),
+                    company=user_info.get('company', ''),
+                    followers=user_info.get('followers', 0),
+                    following=user_info.get('following', 0),
+                    public_repos=user_info.get('public_repos', 0),
+                    account_created=user_info.get('created_at', ''),
+                    last_updated=user_info.get('updated_at', '')
+                )
                 results.append(contributor_data)
                 
                 # Show sample data for each contributor
                 self._show_sample_contributor(contributor_data)
-                
-                # Sleep between user profile requests to avoid rate limits
-                time.sleep(1)
             else:
                 logger.warning(f"⚠️  Could not fetch details for @{username}")
         
         logger.info(f"✅ Completed processing {project_name}: {len(results)} top contributor profiles extracted")
         return results
     
-    def _show_sample_contributor(self, contributor_info: Dict):
+    def _show_sample_contributor(self, contributor_info: ContributorRow):
         """Display sample contributor information"""
-        name = contributor_info.get('contributor_name', 'N/A')
-        username = contributor_info.get('contributor_username', 'N/A')
-        contributions = contributor_info.get('contributions', 0)
-        email = contributor_info.get('contributor_email', 'N/A')
-        twitter = contributor_info.get('twitter', 'N/A')
+        # Called for every contributor, so skip the work when INFO is not logged
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        name = contributor_info.contributor_name
+        username = contributor_info.contributor_username
+        contributions = contributor_info.contributions
+        email = contributor_info.contributor_email
+        twitter = contributor_info.twitter
         
-        logger.info(f"👤 {name} (@{username}) - {contributions} contributions")
+        logger.info("👤 %s (@%s) - %s contributions", name, username, contributions)
         if email != 'N/A':
-            logger.info(f"   📧 Email: {email}")
+            logger.info("   📧 Email: %s", email)
         if twitter != 'N/A':
-            logger.info(f"   🐦 Twitter: @{twitter}")
+            logger.info("   🐦 Twitter: @%s", twitter)
 
-    def save_to_csv(self, data: List[Dict], filename: str):
-        """Save data to CSV file"""
-        if not data:
-            logger.warning("No data to save")
-            return
+    def _open_csv(self, filename: str, compress: bool = False, append: bool = False):
+        """Open a CSV file for writing (or appending), gzip-compressed when compress is set
+        
+        Compression uses the fastest level, which still shrinks the repetitive
+        contributor rows several times over at negligible CPU cost.
+        """
+        mode = 'a' if append else 'w'
+        if compress:
+            return gzip.open(filename, mode + 't', compresslevel=1, newline='', encoding='utf-8')
+        return open(filename, mode, newline='', encoding='utf-8')
+
+    def _load_checkpoint(self, output_file: str, settings: Dict) -> Optional[Dict]:
+        """Return the progress of an interrupted run writing output_file, or None to start afresh
+        
+        The output is truncated back to the offset recorded with the last
+        completed organization, dropping the rows (possibly cut off mid-line) of
+        one that was interrupted; the usernames already written are then read
+        back from the output itself. A checkpoint of a run with other settings
+        raises ValueError rather than mixing its rows with different ones.
+        """
+        state_file = output_file + '.state'
+        if not (os.path.exists(state_file) and os.path.exists(output_file)):
+            return None
         
-        # Get all unique keys from all dictionaries to handle dynamic fields
-        all_keys = set()
-        for item in data:
-            all_keys.update(item.keys())
+        try:
+            with open(state_file, 'rb') as f:
+                state = decode_json(f.read())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not resume from {state_file}, starting afresh: {e}")
+            return None
         
-        fieldnames = sorted(all_keys)
+        checkpoint_settings = {key: state.get(key) for key in settings}
+        if checkpoint_settings != settings:
+            raise ValueError(f"{output_file} was started with {checkpoint_settings}, not {settings}; "
+                             f"rerun with those settings or remove {state_file}")
         
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+        try:
+            with open(output_file, 'r+b') as f:
+                if f.seek(0, os.SEEK_END) < state['offset']:
+                    raise ValueError(f"{output_file} is shorter than its checkpoint")
+                f.truncate(state['offset'])
+            with open(output_file, 'r', newline='', encoding='utf-8') as csvfile:
+                state['seen'] = {row['contributor_username'] for row in csv.DictReader(csvfile)}
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not resume from {state_file}, starting afresh: {e}")
+            return None
+        return state
+
+    def _save_checkpoint(self, output_file: str, state: Dict):
+        """Atomically record the progress of a run writing output_file"""
+        state_file = output_file + '.state'
+        with open(state_file + '.tmp', 'w', encoding='utf-8') as f:
+            f.write(encode_json(state))
+        os.replace(state_file + '.tmp', state_file)
+
+    def save_to_csv(self, data: List[NamedTuple], filename: str, compress: bool = False):
+        """Save contributor rows to CSV file (gzip-compressed with compress, adding a .gz suffix)"""
+        if not data:
+            logger.warning("No data to save")
+            return
+        if compress and not filename.endswith('.gz'):
+            filename += '.gz'
+        
+        # Rows are tuples in column order, so they are written as-is under
+        # the header of their row type
+        with self._open_csv(filename, compress) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(data[0]._fields)
             writer.writerows(data)
         
         logger.info(f"Data saved to {filename}")
 
-    def run_extraction(self, max_contributors_per_repo: int = 3, output_file: str = None) -> str:
-        """Run the extraction process"""
+    def run_extraction(self, max_contributors_per_repo: int = 3, output_file: str = None,
+                       compress: bool = False) -> str:
+        """Run the extraction process (with compress, the CSV is written gzip-compressed)"""
         if output_file is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = f"blockchain_contributors_{timestamp}.csv"
+        if compress and not output_file.endswith('.gz'):
+            output_file += '.gz'
         
         logger.info("🌟 Starting blockchain contributors extraction")
         logger.info(f"📋 Processing {len(self.blockchain_repos)} top repositories")
         logger.info(f"👥 Getting top {max_contributors_per_repo} contributors per repository")
         
-        all_contributors = []
         seen_usernames = set()  # Track unique usernames to avoid duplicates
-        
-        for i, repo_info in enumerate(self.blockchain_repos, 1):
-            repo_name = repo_info['name']
-            logger.info(f"\n📁 [{i}/{len(self.blockchain_repos)}] Processing: {repo_name}")
-            logger.info("=" * 50)
+        contributing_repos = 0  # Repositories that added at least one new contributor
+        
+        # The output is opened once and new contributors are appended after each
+        # repository, so progress is saved without rewriting the whole file.
+        # Repositories are processed concurrently and consumed in the original order
+        with self._open_csv(output_file, compress) as csvfile, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            writer = csv.writer(csvfile)
+            writer.writerow(CONTRIBUTOR_FIELDNAMES)
             
-            try:
-                repo_contributors = self.extract_contributors_data(repo_info, max_contributors_per_repo)
-                
-                # Add only new contributors (avoid duplicates)
-                new_contributors = []
-                for contributor in repo_contributors:
-                    username = contributor['contributor_username']
-                    if username not in seen_usernames:
-                        seen_usernames.add(username)
-                        new_contributors.append(contributor)
-                    else:
-                        logger.info(f"⚠️  Skipping duplicate contributor: @{username}")
-                
-                all_contributors.extend(new_contributors)
-                logger.info(f"✅ Added {len(new_contributors)} new contributors from {repo_name}")
-                logger.info(f"📈 Total unique contributors so far: {len(all_contributors)}")
-                
-                # Save progress after each repository
-                self.save_to_csv(all_contributors, output_file)
-                
-                # Sleep between repositories to avoid rate limits
-                if i < len(self.blockchain_repos):
-                    logger.info(f"⏳ Sleeping 2 seconds before next repository...")
-                    time.sleep(2)
+            futures = [executor.submit(self.extract_contributors_data, repo_info, max_contributors_per_repo)
+                       for repo_info in self.blockchain_repos]
+            
+            for i, (repo_info, future) in enumerate(zip(self.blockchain_repos, futures), 1):
+                repo_name = repo_info['name']
+                logger.info(f"\n📁 [{i}/{len(self.blockchain_repos)}] Processing: {repo_name}")
+                logger.info("=" * 50)
                 
-            except Exception as e:
-                logger.error(f"❌ Error processing {repo_info['name']}: {e}")
-                continue
+                try:
+                    repo_contributors = future.result()
+                    
+                    # Add only new contributors (avoid duplicates)
+                    new_contributors = []
+                    for contributor in repo_contributors:
+                        username = contributor.contributor_username
+                        if username not in seen_usernames:
+                            seen_usernames.add(username)
+                            new_contributors.append(contributor)
+                        else:
+                            logger.info("⚠️  Skipping duplicate contributor: @%s", username)
+                    
+                    if new_contributors:
+                        contributing_repos += 1
+                    logger.info(f"✅ Added {len(new_contributors)} new contributors from {repo_name}")
+                    logger.info(f"📈 Total unique contributors so far: {len(seen_usernames)}")
+                    
+                    # Save progress after each repository
+                    writer.writerows(new_contributors)
+                    csvfile.flush()
+                    
+                except Exception as e:
+                    logger.error(f"❌ Error processing {repo_info['name']}: {e}")
+                    continue
         
         logger.info(f"\n📊 Final Statistics:")
-        logger.info(f"   ✅ Successfully processed: {len([r for r in self.blockchain_repos if any(c['project_name'] == r['name'] for c in all_contributors)])} repositories")
-        logger.info(f"   👥 Total unique contributors: {len(all_contributors)}")
+        logger.info(f"   ✅ Successfully processed: {contributing_repos} repositories")
+        logger.info(f"   👥 Total unique contributors: {len(seen_usernames)}")
         logger.info(f"   📁 Results saved to: {output_file}")
         
         return output_file
 
-    def run_blockchain_extraction_with_top_repos(self, max_contributors_per_repo: int = 3, output_file: str = None) -> str:
-        """Run the extraction process for blockchain organizations with their top repositories"""
+    def run_blockchain_extraction_with_top_repos(self, max_contributors_per_repo: int = 3, output_file: str = None,
+                                                 compress: bool = False, strategy: str = 'top-repos') -> str:
+        """Run the extraction process for blockchain organizations with their top repositories
+        
+        strategy picks the repositories analyzed for each blockchain (see
+        EXTRACTION_STRATEGIES): its organization's top 5 ('top-repos'), only the
+        repository its CSV row names, without listing the organization
+        ('csv-repo'), or the named repository as well as the top 5 ('both').
+        With compress, the CSV is written gzip-compressed. Otherwise progress is
+        recorded next to the output in a .state file after each organization, so
+        running again with the same output_file after an interruption skips the
+        organizations already processed and appends to the existing output; a
+        checkpoint left by a run with another strategy or
+        max_contributors_per_repo raises ValueError.
+        """
         if output_file is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = f"blockchain_contributors_{timestamp}.csv"
+        if compress and not output_file.endswith('.gz'):
+            output_file += '.gz'
+        if strategy not in EXTRACTION_STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}', expected one of {', '.join(EXTRACTION_STRATEGIES)}")
         
         logger.info("🌟 Starting blockchain contributors extraction with top repositories")
         logger.info(f"📋 Processing {len(self.blockchain_repos)} blockchain organizations")
         logger.info(f"👥 Getting top {max_contributors_per_repo} contributors per repository")
-        logger.info(f"🔍 Getting top 5 repositories per organization")
-        
-        all_contributors = []
-        seen_usernames = set()  # Track unique usernames to avoid duplicates
+        if strategy == 'csv-repo':
+            logger.info(f"🔍 Getting the repository listed for each organization")
+        else:
+            logger.info(f"🔍 Getting top 5 repositories per organization")
+        
+        # A gzip stream cut short cannot be truncated back to a readable state,
+        # so compressed output is not checkpointed and always starts afresh.
+        # Rows are only appended to output written with the same settings
+        settings = {'strategy': strategy, 'max_contributors': max_contributors_per_repo}
+        state = None if compress else self._load_checkpoint(output_file, settings)
+        resuming = state is not None
+        if state is None:
+            state = {'done': [], 'repos': [], 'seen': set()}
+        
+        seen_usernames = state['seen']  # Track unique usernames to avoid duplicates
+        processed_repos = set(state['repos'])  # Repositories already processed for an earlier organization
+        done_orgs = set(state['done'])  # Organizations completed by an interrupted run
+        pending_orgs = [blockchain_info for blockchain_info in self.blockchain_repos
+                        if f"{blockchain_info['owner']}/{blockchain_info['repo']}".lower() not in done_orgs]
+        if resuming:
+            logger.info(f"♻️  Resuming {output_file}: skipping {len(self.blockchain_repos) - len(pending_orgs)} "
+                        f"organizations already processed")
         successful_orgs = 0
         failed_orgs = 0
         
-        for i, blockchain_info in enumerate(self.blockchain_repos, 1):
-            owner = blockchain_info['owner']
-            repo = blockchain_info['repo']
-            project_name = blockchain_info['name']
+        # The output is opened once and new contributors are appended after each
+        # organization, so progress is saved without rewriting the whole file.
+        # Each organization's top repositories are listed ahead of time in their
+        # own pool, so the next listing is usually ready when an organization is done
+        with self._open_csv(output_file, compress, append=resuming) as csvfile, \
+                ThreadPoolExecutor(max_workers=2, thread_name_prefix='github-listing') as listing_executor, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            writer = csv.writer(csvfile)
+            if not resuming:
+                writer.writerow(BLOCKCHAIN_CONTRIBUTOR_FIELDNAMES)
             
-            logger.info(f"\n📁 [{i}/{len(self.blockchain_repos)}] Processing: {project_name} ({owner})")
-            logger.info("=" * 60)
+            if strategy == 'csv-repo':
+                listings = [listing_executor.submit(self.get_csv_repository, blockchain_info['owner'], blockchain_info['repo'])
+                            for blockchain_info in pending_orgs]
+            else:
+                listings = [listing_executor.submit(self.get_top_repositories_for_blockchain,
+                                                    blockchain_info['owner'], blockchain_info['repo'], 5, strategy == 'both')
+                            for blockchain_info in pending_orgs]
             
-            try:
-                # Get top 5 repositories for this blockchain organization
-                top_repos = self.get_top_repositories_for_blockchain(owner, repo, limit=5)
+            for i, (blockchain_info, listing) in enumerate(zip(pending_orgs, listings), 1):
+                owner = blockchain_info['owner']
+                project_name = blockchain_info['name']
                 
-                if not top_repos:
-                    logger.warning(f"⚠️  No repositories found for {owner}")
-                    failed_orgs += 1
-                    continue
+                logger.info(f"\n📁 [{i}/{len(pending_orgs)}] Processing: {project_name} ({owner})")
+                logger.info("=" * 60)
                 
-                # Process each repository
-                for repo_info in top_repos:
-                    logger.info(f"🔍 Processing repository: {repo_info['name']}")
-                    repo_contributors = self.extract_contributors_data(repo_info, max_contributors_per_repo)
+                try:
+                    # Get top 5 repositories for this blockchain organization
+                    top_repos = listing.result()
                     
-                    # Add blockchain metadata to each contributor
-                    for contributor in repo_contributors:
-                        contributor['blockchain_name'] = project_name
-                        contributor['blockchain_layer_type'] = blockchain_info.get('layer_type', '')
-                        contributor['blockchain_category'] = blockchain_info.get('category', '')
-                        contributor['blockchain_purpose'] = blockchain_info.get('purpose', '')
-                        contributor['blockchain_description'] = blockchain_info.get('description', '')
-                        contributor['repo_stars'] = repo_info.get('stars', 0)
-                        contributor['repo_description'] = repo_info.get('description', '')
+                    if not top_repos:
+                        logger.warning(f"⚠️  No repositories found for {owner}")
+                        failed_orgs += 1
+                        continue
                     
-                    # Add only new contributors (avoid duplicates)
-                    new_contributors = []
-                    for contributor in repo_contributors:
-                        username = contributor['contributor_username']
-                        if username not in seen_usernames:
-                            seen_usernames.add(username)
-                            new_contributors.append(contributor)
-                        else:
-                            logger.info(f"⚠️  Skipping duplicate contributor: @{username}")
+                    # A repository listed for an earlier organization would only
+                    # yield contributors that were already seen
+                    top_repos = [repo_info for repo_info in top_repos
+                                 if f"{repo_info['owner']}/{repo_info['repo']}".lower() not in processed_repos]
+                    processed_repos.update(f"{repo_info['owner']}/{repo_info['repo']}".lower()
+                                           for repo_info in top_repos)
                     
-                    all_contributors.extend(new_contributors)
-                    logger.info(f"✅ Added {len(new_contributors)} new contributors from {repo_info['name']}")
-                
-                successful_orgs += 1
-                logger.info(f"📈 Total unique contributors so far: {len(all_contributors)}")
-                
-                # Save progress after each organization
-                self.save_to_csv(all_contributors, output_file)
-                
-                # Sleep between organizations to avoid rate limits
-                if i < len(self.blockchain_repos):
-                    logger.info(f"⏳ Sleeping 3 seconds before next organization...")
-                    time.sleep(3)
-                
-            except Exception as e:
-                failed_orgs += 1
-                logger.error(f"❌ Error processing {project_name}: {e}")
-                continue
+                    # Process the organization's repositories concurrently, in order
+                    futures = [executor.submit(self.extract_contributors_data, repo_info, max_contributors_per_repo)
+                               for repo_info in top_repos]
+                    for repo_info, future in zip(top_repos, futures):
+                        logger.info(f"🔍 Processing repository: {repo_info['name']}")
+                        repo_contributors = future.result()
+                        
+                        # Add blockchain metadata to each contributor
+                        repo_contributors = [
+                            BlockchainContributorRow(
+                                *contributor,
+                                blockchain_name=project_name,
+                                blockchain_layer_type=blockchain_info.get('layer_type', ''),
+                                blockchain_category=blockchain_info.get('category', ''),
+                                blockchain_purpose=blockchain_info.get('purpose', ''),
+                                blockchain_description=blockchain_info.get('description', ''),
+                                repo_stars=repo_info.get('stars', 0),
+                                repo_description=repo_info.get('description', '')
+                            )
+                            for contributor in repo_contributors
+                        ]
+                        
+                        # Add only new contributors (avoid duplicates)
+                        new_contributors = []
+                        for contributor in repo_contributors:
+                            username = contributor.contributor_username
+                            if username not in seen_usernames:
+                                seen_usernames.add(username)
+                                new_contributors.append(contributor)
+                            else:
+                                logger.info("⚠️  Skipping duplicate contributor: @%s", username)
+                        
+                        writer.writerows(new_contributors)
+                        logger.info(f"✅ Added {len(new_contributors)} new contributors from {repo_info['name']}")
+                    
+                    successful_orgs += 1
+                    logger.info(f"📈 Total unique contributors so far: {len(seen_usernames)}")
+                    
+                    # Save progress after each organization, then record it as done
+                    csvfile.flush()
+                    done_orgs.add(f"{owner}/{blockchain_info['repo']}".lower())
+                    if not compress:
+                        self._save_checkpoint(output_file, {'done': sorted(done_orgs), 'repos': sorted(processed_repos),
+                                                            'offset': csvfile.tell(), **settings})
+                    
+                except Exception as e:
+                    failed_orgs += 1
+                    logger.error(f"❌ Error processing {project_name}: {e}")
+                    continue
         
         logger.info(f"\n📊 Final Statistics:")
         logger.info(f"   ✅ Successfully processed: {successful_orgs} organizations")
         logger.info(f"   ❌ Failed to process: {failed_orgs} organizations")
-        logger.info(f"   👥 Total unique contributors: {len(all_contributors)}")
+        logger.info(f"   👥 Total unique contributors: {len(seen_usernames)}")
         logger.info(f"   📁 Results saved to: {output_file}")
         
+        # The run is complete, so there is nothing left to resume
+        if os.path.exists(output_file + '.state'):
+            os.remove(output_file + '.state')
+        
         return output_file
 
 def main():
@@ -429,28 +938,56 @@ def main():
     print("🚀 Starting GitHub Blockchain Contributors Extraction")
     print("=" * 60)
     
-    # Check for GitHub token
+    # Check for GitHub tokens; GITHUB_TOKENS takes a comma-separated list
+    # whose requests are rotated over, each token adding its own rate limit
     token = os.getenv('GITHUB_TOKEN')
-    if not token:
+    tokens = [t.strip() for t in os.getenv('GITHUB_TOKENS', '').split(',') if t.strip()]
+    if not token and not tokens:
         print("⚠️  No GITHUB_TOKEN found in environment variables.")
         print("   Using unauthenticated requests (limited to 60 requests/hour)")
         print("   For better results, set: export GITHUB_TOKEN=your_token")
         print()
+    elif tokens:
+        print(f"🔑 Rotating requests over {len(tokens)} GitHub tokens")
+    
+    # GH_STRATEGY picks the repositories analyzed: 'top-repos' (each organization's
+    # top 5), 'csv-repo' (only the repository each CSV row names) or 'both'
+    strategy = os.getenv('GH_STRATEGY', 'top-repos')
+    if strategy not in EXTRACTION_STRATEGIES:
+        print(f"❌ Unknown GH_STRATEGY '{strategy}'; use {', '.join(EXTRACTION_STRATEGIES)}")
+        return
+    
+    # GH_OUTPUT_FILE names the output; running again with the same name after
+    # an interruption resumes from its .state checkpoint. Without it, a new
+    # file named with a timestamp is written on every run
+    output_file = os.getenv('GH_OUTPUT_FILE') or None
     
     # Create extractor with blockchain CSV data
-    extractor = SimpleGitHubExtractor(token, blockchain_csv_path='evm_blockchains.csv')
+    extractor = SimpleGitHubExtractor(token, blockchain_csv_path='evm_blockchains.csv', tokens=tokens)
     
-    # Run extraction with blockchain organizations and their top repositories
+    # Run extraction with blockchain organizations and their repositories
     print("📊 Extracting contributors from blockchain organizations with top repositories...")
-    output_file = extractor.run_blockchain_extraction_with_top_repos(
-        max_contributors_per_repo=3  # Get top 3 contributors per repo
-        # output_file will be auto-generated with timestamp
-    )
+    try:
+        output_file = extractor.run_blockchain_extraction_with_top_repos(
+            max_contributors_per_repo=3,  # Get top 3 contributors per repo
+            output_file=output_file,
+            strategy=strategy
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    finally:
+        extractor.close()
     
     print(f"\n✅ Extraction completed!")
     print(f"📁 Results saved to: {output_file}")
     print(f"📈 Total blockchain organizations processed: {len(extractor.blockchain_repos)}")
-    print(f"🔍 Each organization's top 5 repositories analyzed")
+    if strategy == 'csv-repo':
+        print(f"🔍 Each organization's listed repository analyzed")
+    elif strategy == 'both':
+        print(f"🔍 Each organization's listed repository and top 5 repositories analyzed")
+    else:
+        print(f"🔍 Each organization's top 5 repositories analyzed")
     print(f"👥 Top 3 contributors per repository extracted")
 
 if __name__ == "__main__":
@@ -32,7 +32,7 @@ def test_single_repo():
         if contributors:
             print("\nSample contributor data:")
             sample = contributors[0]
-            for key, value in sample.items():
+            for key, value in sample._asdict().items():
                 print(f"  {key}: {value}")
         
         # Save test results